@@ -2,7 +2,7 @@
 Health check endpoint for monitoring application and database status.
 """
 from fastapi import APIRouter, status, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from datetime import datetime
 from typing import Callable, Awaitable
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -54,7 +54,7 @@ async def health_check(
         db_connected = False
     
     if db_connected:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
             content={
                 "status": "healthy",
@@ -63,7 +63,7 @@ async def health_check(
             }
         )
     else:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content={
                 "status": "unhealthy",
@@ -34,7 +34,7 @@ class ScraperResultResponse(BaseModel):
 
 
 @router.post("/cache/invalidate")
-def invalidate_cache():
+async def invalidate_cache():
     """Invalidate the timeline cache. Admin/ops utility.
 
     In setups without auth, treat this as a no-op risk; in production,
@@ -5,12 +5,12 @@ from uuid import UUID
 import hashlib
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
-from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_db
 from app.services.team_service import TeamService
-from app.core.etag import compute_etag
+from app.core.etag import compute_version_etag, not_modified
+from app.repositories.version_repository import VersionRepository
 from app.schemas.team import (
     TeamNodeWithEras,
     TeamNodeResponse,
@@ -36,18 +36,17 @@ async def get_team(
 
     Eager-loads related eras (and lineage events for future use).
     """
+    # Conditional ETag handling: answer 304 from the fingerprint alone
+    fingerprint = await VersionRepository.team_fingerprint(db, node_id)
+    if fingerprint is None:
+        raise NodeNotFoundException(f"TeamNode {node_id} not found")
+    etag = compute_version_etag("team", node_id, *fingerprint)
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
     node = await TeamService.get_node_with_eras(db, node_id)
     if not node:
         raise NodeNotFoundException(f"TeamNode {node_id} not found")
-    # Conditional ETag handling
-    body = jsonable_encoder(node)
-    etag = compute_etag(body)
-    inm = request.headers.get("if-none-match") if request else None
-    if inm == etag:
-        resp = Response(status_code=304)
-        resp.headers["ETag"] = etag
-        resp.headers["Cache-Control"] = "max-age=300"
-        return resp
     if response:
         response.headers["ETag"] = etag
         response.headers["Cache-Control"] = "max-age=300"
@@ -92,19 +91,15 @@ async def get_team_eras(
 
     Optional `year` filters to a specific season; results ordered by season_year DESC.
     """
+    fingerprint = await VersionRepository.team_fingerprint(db, node_id)
     # Ensure node exists for 404 semantics
-    node = await TeamService.get_node_with_eras(db, node_id)
-    if not node:
+    if fingerprint is None:
         raise NodeNotFoundException(f"TeamNode {node_id} not found")
+    etag = compute_version_etag("eras", node_id, year, *fingerprint)
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
     eras = await TeamService.get_node_eras(db, node_id, year_filter=year)
-    body = jsonable_encoder(eras)
-    etag = compute_etag(body)
-    inm = request.headers.get("if-none-match") if request else None
-    if inm == etag:
-        resp = Response(status_code=304)
-        resp.headers["ETag"] = etag
-        resp.headers["Cache-Control"] = "max-age=300"
-        return resp
     if response:
         response.headers["ETag"] = etag
         response.headers["Cache-Control"] = "max-age=300"
@@ -119,34 +114,40 @@ async def list_teams(
     limit: int = Query(default=50, ge=1, le=100),
     active_in_year: Optional[int] = Query(default=None, ge=1900, le=2100),
     tier_level: Optional[int] = Query(default=None, ge=1, le=3),
+    cursor: Optional[str] = Query(default=None, max_length=200),
+    skip_total: bool = Query(default=False),
     db: AsyncSession = Depends(get_db),
 ):
     """List teams with pagination and optional filters.
 
     - active_in_year: only teams with an era in that year
     - tier_level: only teams having any era with the given tier
+    - cursor: `next_cursor` from the previous page; takes precedence over skip
+    - skip_total: omit the COUNT query and return `total: null`
     """
-    nodes, total = await TeamService.list_nodes(
+    fingerprint = await VersionRepository.teams_fingerprint(db)
+    etag = compute_version_etag(
+        "teams", skip, limit, active_in_year, tier_level, cursor, skip_total, *fingerprint
+    )
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+    nodes, total, next_cursor = await TeamService.list_nodes(
         db,
         skip=skip,
         limit=limit,
         active_in_year=active_in_year,
         tier_level=tier_level,
+        cursor=cursor,
+        with_total=not skip_total,
     )
     payload = {
         "items": nodes,
         "total": total,
         "skip": skip,
         "limit": limit,
+        "next_cursor": next_cursor,
     }
-    body = jsonable_encoder(payload)
-    etag = compute_etag(body)
-    inm = request.headers.get("if-none-match") if request else None
-    if inm == etag:
-        resp = Response(status_code=304)
-        resp.headers["ETag"] = etag
-        resp.headers["Cache-Control"] = "max-age=300"
-        return resp
     if response:
         response.headers["ETag"] = etag
         response.headers["Cache-Control"] = "max-age=300"
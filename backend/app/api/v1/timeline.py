@@ -1,13 +1,12 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, Query, Request, Response
-from fastapi.encoders import jsonable_encoder
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_db
 from app.schemas.timeline import TimelineResponse
 from app.services.timeline_service import TimelineService
-from app.core.etag import compute_etag
+from app.core.etag import not_modified
 
 router = APIRouter(prefix="/api/v1", tags=["timeline"])
 
@@ -15,7 +14,6 @@ router = APIRouter(prefix="/api/v1", tags=["timeline"])
 @router.get("/timeline", response_model=TimelineResponse)
 async def get_timeline(
     request: Request,
-    response: Response,
     start_year: int = Query(1900, ge=1900, le=2100),
     end_year: int = Query(datetime.utcnow().year, ge=1900, le=2100),
     include_dissolved: bool = True,
@@ -23,20 +21,18 @@ async def get_timeline(
     session: AsyncSession = Depends(get_db),
 ):
     service = TimelineService(session)
-    data = await service.get_graph_data(
+    # The graph is already in its response shape; send the cached JSON bytes
+    # as-is instead of re-validating and re-encoding them per request.
+    inm = request.headers.get("if-none-match")
+    body, etag = await service.get_graph_json(
         start_year=start_year,
         end_year=end_year,
         include_dissolved=include_dissolved,
         tier_filter=tier_filter,
+        if_none_match=inm,
     )
-    body = jsonable_encoder(data)
-    etag = compute_etag(body)
-    inm = request.headers.get("if-none-match")
-    if inm == etag:
-        resp = Response(status_code=304)
-        resp.headers["ETag"] = etag
-        resp.headers["Cache-Control"] = "max-age=300"
-        return resp
-    response.headers["ETag"] = etag
-    response.headers["Cache-Control"] = "max-age=300"
-    return data
+    unchanged = not_modified(request, etag)
+    if unchanged:
+        return unchanged
+    headers = {"ETag": etag, "Cache-Control": "max-age=300"}
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any
+from typing import Any, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
 
 
 def compute_etag(payload: Any) -> str:
@@ -17,3 +20,18 @@ def compute_etag(payload: Any) -> str:
         data = str(payload)
     digest = hashlib.sha256(data.encode("utf-8")).hexdigest()
     return f"W/\"{digest}\""
+
+
+def compute_version_etag(*parts: Any) -> str:
+    """Compute an ETag from a data fingerprint and the request parameters.
+
+    Lets endpoints answer If-None-Match without building the response body.
+    """
+    return compute_etag([str(part) for part in parts])
+
+
+def not_modified(request: Request, etag: str, cache_control: str = "max-age=300") -> Optional[Response]:
+    """Return a bodiless 304 when the client's If-None-Match matches ``etag``."""
+    if request.headers.get("if-none-match") != etag:
+        return None
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
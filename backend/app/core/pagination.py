@@ -0,0 +1,27 @@
+"""Opaque keyset cursors for list endpoints."""
+import base64
+from typing import Tuple
+from uuid import UUID
+
+import orjson
+
+from app.core.exceptions import ValidationException
+
+
+def encode_cursor(sort_value: int, row_id: UUID) -> str:
+    """Encode the last row's (sort key, id) as an opaque, URL-safe cursor."""
+    raw = orjson.dumps([sort_value, str(row_id)])
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[int, UUID]:
+    """Decode a cursor from ``encode_cursor``; raise ValidationException if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = orjson.loads(base64.urlsafe_b64decode(padded))
+        # Well-formed JSON of the wrong shape must still be a 422, not a crash
+        if not isinstance(sort_value, int) or isinstance(sort_value, bool) or not isinstance(row_id, str):
+            raise ValueError("cursor has wrong types")
+        return sort_value, UUID(row_id)
+    except (ValueError, TypeError):
+        raise ValidationException("Invalid pagination cursor")
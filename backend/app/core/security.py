@@ -1,34 +1,67 @@
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
+from functools import lru_cache
 from typing import Optional
 from jose import JWTError, jwt
-from passlib.context import CryptContext
+import base64
 import hashlib
+import hmac
+import orjson
+import time
 import uuid
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# The HS256 header never changes, so its encoded segment is built once
+_HS256_HEADER_SEGMENT = _b64url(orjson.dumps({"alg": "HS256", "typ": "JWT"}))
+
+
+@lru_cache(maxsize=1)
+def _hs256_mac(secret: str) -> hmac.HMAC:
+    # Keyed HMAC state; copying it per token skips re-deriving the key pads
+    return hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def _encode_jwt(claims: dict) -> str:
+    """Sign claims with the configured key.
+
+    HS256 tokens are assembled directly from the precomputed header and keyed
+    HMAC; other algorithms go through python-jose.
+    """
+    if settings.JWT_ALGORITHM != "HS256":
+        return jwt.encode(claims, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    signing_input = _HS256_HEADER_SEGMENT + b"." + _b64url(orjson.dumps(claims))
+    mac = _hs256_mac(settings.JWT_SECRET_KEY).copy()
+    mac.update(signing_input)
+    return (signing_input + b"." + _b64url(mac.digest())).decode("ascii")
+
+
+def _expires_at(seconds: float) -> int:
+    # JWT "exp" is integer epoch seconds; time.time() avoids building datetimes
+    return int(time.time() + seconds)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire = _expires_at(expires_delta.total_seconds())
     else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = _expires_at(settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60)
     
     to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
-    return encoded_jwt
+    return _encode_jwt(to_encode)
 
 
 def create_refresh_token(data: dict):
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(days=settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS)
+    expire = _expires_at(settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS * 86400)
     # Include a unique identifier to ensure distinct tokens per issuance
     to_encode.update({"exp": expire, "type": "refresh", "jti": str(uuid.uuid4())})
-    encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
-    return encoded_jwt
+    return _encode_jwt(to_encode)
 
 
 def verify_token(token: str) -> Optional[dict]:
@@ -39,10 +72,21 @@ def verify_token(token: str) -> Optional[dict]:
         return None
 
 
+@lru_cache(maxsize=1)
+def _token_hash_key(secret: str) -> bytes:
+    # Digest the secret so any length fits BLAKE2b's 64-byte key limit
+    return hashlib.sha256(secret.encode("utf-8")).digest()
+
+
 def hash_token(token: str) -> str:
-    # Use SHA-256 to safely hash arbitrarily long tokens (bcrypt has a 72-byte limit)
-    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+    # Refresh tokens are high-entropy signed JWTs, so a fast keyed BLAKE2b MAC
+    # suffices; keying it means stored hashes can't be matched without the secret
+    return hashlib.blake2b(
+        token.encode("utf-8"),
+        key=_token_hash_key(settings.JWT_SECRET_KEY),
+        digest_size=32,
+    ).hexdigest()
 
 
 def verify_token_hash(token: str, hashed: str) -> bool:
-    return hashlib.sha256(token.encode("utf-8")).hexdigest() == hashed
+    return hmac.compare_digest(hash_token(token), hashed)
@@ -1,14 +1,35 @@
 """Database configuration and session management for async SQLAlchemy."""
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy import text
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import make_url
 from app.core.config import settings
 from app.db.base import Base  # Unified Base import so metadata matches models
 
+
+def _engine_options(database_url: str) -> dict:
+    """Pool and driver options for the configured database backend."""
+    url = make_url(database_url)
+    if url.get_backend_name() != "postgresql":
+        # SQLite (tests, local runs) keeps SQLAlchemy's default pooling
+        return {}
+    options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    }
+    if url.get_driver_name() == "asyncpg":
+        # asyncpg keeps prepared statements per connection for reuse
+        options["connect_args"] = {"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    return options
+
+
 # Create async engine (single shared engine for application)
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     future=True,
+    **_engine_options(settings.DATABASE_URL),
 )
 
 # Create async session factory bound to the unified Base metadata
@@ -25,10 +46,21 @@ async def get_db() -> AsyncSession:
         yield session
 
 
+def _create_missing_tables(sync_conn) -> None:
+    # One catalog query for all table names instead of a has_table probe per table
+    existing = set(inspect(sync_conn).get_table_names())
+    missing = [t for t in Base.metadata.sorted_tables if t.name not in existing]
+    if missing:
+        Base.metadata.create_all(sync_conn, tables=missing, checkfirst=False)
+
+
 async def create_tables():
-    """Create tables from model metadata (only useful before migrations exist)."""
+    """Create tables from model metadata (only useful before migrations exist).
+
+    Idempotent: tables that already exist are left alone.
+    """
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_tables)
 
 
 async def check_db_connection() -> bool:
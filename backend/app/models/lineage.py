@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, Text, Enum, CheckConstraint, DateTime
+from sqlalchemy import Column, ForeignKey, Integer, Text, Enum, CheckConstraint, DateTime, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 from app.db.types import GUID
@@ -25,6 +25,11 @@ class LineageEvent(Base):
     __table_args__ = (
         CheckConstraint('(previous_node_id IS NOT NULL OR next_node_id IS NOT NULL)', name='ck_lineage_event_node_not_null'),
         CheckConstraint('event_year >= 1900', name='ck_lineage_event_year_min'),
+        # Mirrors the indexes created in migration 003
+        Index('idx_lineage_event_prev', 'previous_node_id'),
+        Index('idx_lineage_event_next', 'next_node_id'),
+        Index('idx_lineage_event_year', 'event_year'),
+        Index('idx_lineage_event_type', 'event_type'),
     )
 
     def is_merge(self):
@@ -33,6 +33,7 @@ class SponsorMaster(Base):
     )
     updated_at: Mapped[datetime] = mapped_column(
         default=datetime.utcnow,
+        onupdate=datetime.utcnow,
         nullable=False
     )
     
@@ -70,6 +71,7 @@ class SponsorBrand(Base):
     )
     updated_at: Mapped[datetime] = mapped_column(
         default=datetime.utcnow,
+        onupdate=datetime.utcnow,
         nullable=False
     )
     
@@ -132,6 +134,7 @@ class TeamSponsorLink(Base):
     )
     updated_at: Mapped[datetime] = mapped_column(
         default=datetime.utcnow,
+        onupdate=datetime.utcnow,
         nullable=False
     )
     
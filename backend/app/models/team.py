@@ -13,6 +13,7 @@ from sqlalchemy import (
     Boolean,
     ForeignKey,
     UniqueConstraint,
+    Index,
 )
 from sqlalchemy.orm import Mapped, mapped_column, validates, relationship
 from app.db.base import Base, TimestampMixin
@@ -121,7 +122,12 @@ class TeamEra(Base, TimestampMixin):
     )
 
     __table_args__ = (
+        # Also rejects duplicate eras on insert (see TeamService.create_era)
         UniqueConstraint("node_id", "season_year", name="uq_node_year"),
+        # Mirrors the indexes created in migration 002
+        Index("idx_team_era_node", "node_id"),
+        Index("idx_team_era_year", "season_year"),
+        Index("idx_team_era_manual", "is_manual_override"),
         CheckConstraint(
             "season_year >= 1900 AND season_year <= 2100",
             name="check_season_year_range",
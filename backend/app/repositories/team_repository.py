@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select, func, distinct
+from sqlalchemy import select, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -47,47 +47,52 @@ class TeamRepository:
         limit: int = 50,
         active_in_year: Optional[int] = None,
         tier_level: Optional[int] = None,
-    ) -> Tuple[List[TeamNode], int]:
-        # Base selectable
-        base_stmt = select(TeamNode)
+        after: Optional[Tuple[int, UUID]] = None,
+        with_total: bool = True,
+    ) -> Tuple[List[TeamNode], Optional[int], bool]:
+        """Return a page of nodes, the filtered total and whether more follow.
 
-        if active_in_year is not None:
-            # Filter nodes that have eras in the given year
-            base_stmt = (
-                base_stmt.join(TeamEra, TeamEra.node_id == TeamNode.node_id)
-                .where(TeamEra.season_year == active_in_year)
-            )
-
-        if tier_level is not None:
-            # Filter by tier_level via eras; a team is included if any era matches tier
-            if active_in_year is None:
-                base_stmt = base_stmt.join(TeamEra, TeamEra.node_id == TeamNode.node_id)
-            base_stmt = base_stmt.where(TeamEra.tier_level == tier_level)
-
-        # Total count (distinct nodes if joins present)
-        count_stmt = select(func.count(distinct(TeamNode.node_id)))
+        Nodes are ordered by (founding_year, node_id). With ``after`` (the last
+        key of the previous page) the page starts right after it using an
+        index-friendly keyset predicate and ``skip`` is ignored. The COUNT
+        query is skipped (total is None) when ``with_total`` is False.
+        """
+        filters = []
         if active_in_year is not None or tier_level is not None:
-            # replicate joins/filters for count
-            count_stmt = count_stmt.select_from(TeamNode)
-            if active_in_year is not None or tier_level is not None:
-                count_stmt = count_stmt.join(TeamEra, TeamEra.node_id == TeamNode.node_id)
+            # A team matches if any single era satisfies every era filter
+            era_stmt = select(TeamEra.node_id)
             if active_in_year is not None:
-                count_stmt = count_stmt.where(TeamEra.season_year == active_in_year)
+                era_stmt = era_stmt.where(TeamEra.season_year == active_in_year)
             if tier_level is not None:
-                count_stmt = count_stmt.where(TeamEra.tier_level == tier_level)
+                era_stmt = era_stmt.where(TeamEra.tier_level == tier_level)
+            filters.append(TeamNode.node_id.in_(era_stmt))
 
-        total = (await session.execute(count_stmt)).scalar_one()
+        total = None
+        if with_total:
+            count_stmt = select(func.count()).select_from(TeamNode).where(*filters)
+            total = int((await session.execute(count_stmt)).scalar_one())
 
-        # Data query with pagination and eager loading of eras for convenience
+        # Data query with pagination and eager loading of eras for convenience;
+        # one extra row tells whether another page exists
         data_stmt = (
-            base_stmt.options(
+            select(TeamNode)
+            .where(*filters)
+            .options(
                 selectinload(TeamNode.eras)
                 .selectinload(TeamEra.sponsor_links)
                 .selectinload(TeamSponsorLink.brand)
-            ).offset(skip).limit(limit)
+            )
+            .order_by(TeamNode.founding_year, TeamNode.node_id)
+            .limit(limit + 1)
         )
-        nodes = list((await session.execute(data_stmt)).scalars().unique().all())
-        return nodes, int(total)
+        if after is not None:
+            data_stmt = data_stmt.where(
+                tuple_(TeamNode.founding_year, TeamNode.node_id) > tuple_(*after)
+            )
+        else:
+            data_stmt = data_stmt.offset(skip)
+        nodes = list((await session.execute(data_stmt)).scalars().all())
+        return nodes[:limit], total, len(nodes) > limit
 
     @staticmethod
     async def get_eras_for_node(
@@ -1,6 +1,10 @@
+import asyncio
+from typing import Optional, Sequence
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, or_
 from sqlalchemy.orm import selectinload
+from app.db import database
 from app.models.team import TeamEra, TeamNode
 from app.models.sponsor import TeamSponsorLink
 from app.models.lineage import LineageEvent
@@ -9,42 +13,76 @@ from app.models.lineage import LineageEvent
 class TimelineRepository:
     """Repository for timeline queries with consolidated eager-loads.
 
-    This initial stub centralizes the query shape used by TimelineService,
-    preloading sponsor links/brands and adjacent lineage nodes to avoid async
-    lazy-loads during serialization.
+    Centralizes the query shape used by TimelineService. Year range, tier and
+    dissolution filters are applied in SQL so only the rows that end up in the
+    graph are transferred, and era nodes and sponsor links/brands are preloaded
+    to avoid async lazy-loads during serialization.
+
+    On servers (anything but SQLite) eras and events are read concurrently:
+    events go through a second session from the application's session factory,
+    so a cold request briefly holds two pool connections and the two reads run
+    in separate transactions. A write committed between them can show up in
+    one result and not the other; the timeline is a cached, read-mostly view
+    and already tolerates links whose nodes fall outside the filters, so the
+    overlap is preferred over a single snapshot. Pass ``concurrent=False`` to
+    read both on the caller's session instead.
     """
 
+    def __init__(self, *, concurrent: Optional[bool] = None):
+        # None picks by backend: SQLite shares one connection, so read serially
+        self.concurrent = concurrent
+
     async def fetch_eras_and_events(
         self,
         session: AsyncSession,
         *,
-        year: int | None = None,
-        tier: int | None = None,
+        start_year: int,
+        end_year: int,
+        tiers: Sequence[int] | None = None,
+        include_dissolved: bool = True,
     ) -> tuple[list[TeamEra], list[LineageEvent]]:
         era_stmt = (
             select(TeamEra)
+            .where(TeamEra.season_year.between(start_year, end_year))
             .options(
                 selectinload(TeamEra.node),
                 selectinload(TeamEra.sponsor_links).selectinload(TeamSponsorLink.brand),
             )
         )
-        if year is not None:
-            era_stmt = era_stmt.where(TeamEra.season_year == year)
-        if tier is not None:
-            era_stmt = era_stmt.where(TeamEra.tier_level == tier)
-
-        event_stmt = (
-            select(LineageEvent)
-            .options(
-                selectinload(LineageEvent.previous_node).selectinload(TeamNode.eras)
-                .selectinload(TeamEra.sponsor_links).selectinload(TeamSponsorLink.brand),
-                selectinload(LineageEvent.next_node).selectinload(TeamNode.eras)
-                .selectinload(TeamEra.sponsor_links).selectinload(TeamSponsorLink.brand),
+        if tiers is not None:
+            era_stmt = era_stmt.where(TeamEra.tier_level.in_(tiers))
+        if not include_dissolved:
+            # Drop teams that dissolved within (or before the end of) the window
+            era_stmt = era_stmt.join(TeamNode, TeamEra.node_id == TeamNode.node_id).where(
+                or_(TeamNode.dissolution_year.is_(None), TeamNode.dissolution_year > end_year)
             )
+
+        # Links only need the event's own columns (node ids, year, type), so
+        # adjacent nodes are not eager-loaded here.
+        event_stmt = select(LineageEvent).where(
+            LineageEvent.event_year.between(start_year, end_year)
         )
-        if year is not None:
-            event_stmt = event_stmt.where(LineageEvent.event_year == year)
 
-        eras = list((await session.execute(era_stmt)).scalars().all())
-        events = list((await session.execute(event_stmt)).scalars().all())
+        concurrent = self.concurrent
+        if concurrent is None:
+            bind = session.bind
+            concurrent = bind is not None and bind.dialect.name != "sqlite"
+        if not concurrent:
+            eras = await self._fetch_all(session, era_stmt)
+            events = await self._fetch_all(session, event_stmt)
+            return eras, events
+
+        # An AsyncSession can't run statements concurrently, so events are read
+        # on a session of their own. It comes from the application's factory
+        # (its own pooled connection), never from the caller's bind, which may
+        # be a single Connection that must not be shared between two sessions.
+        async with database.async_session_maker() as events_session:
+            eras, events = await asyncio.gather(
+                self._fetch_all(session, era_stmt),
+                self._fetch_all(events_session, event_stmt),
+            )
         return eras, events
+
+    @staticmethod
+    async def _fetch_all(session: AsyncSession, stmt) -> list:
+        return list((await session.execute(stmt)).scalars().all())
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.team import TeamNode, TeamEra
+from app.models.sponsor import TeamSponsorLink, SponsorBrand
+from app.models.lineage import LineageEvent
+
+
+class VersionRepository:
+    """Cheap data fingerprints used to answer conditional GETs.
+
+    Each fingerprint is the row count and latest ``updated_at`` of every table
+    a response is built from, fetched in a single statement. Any insert,
+    update or delete through the ORM changes it, so an unchanged fingerprint
+    means a previously issued ETag is still valid without rebuilding the body.
+    """
+
+    @staticmethod
+    async def timeline_fingerprint(session: AsyncSession) -> Tuple:
+        return await VersionRepository._fingerprint(
+            session,
+            [
+                (TeamNode, None),
+                (TeamEra, None),
+                (TeamSponsorLink, None),
+                (SponsorBrand, None),
+                (LineageEvent, None),
+            ],
+        )
+
+    @staticmethod
+    async def teams_fingerprint(session: AsyncSession) -> Tuple:
+        # List filters (active year, tier) are evaluated against eras
+        return await VersionRepository._fingerprint(
+            session, [(TeamNode, None), (TeamEra, None)]
+        )
+
+    @staticmethod
+    async def team_fingerprint(session: AsyncSession, node_id: UUID) -> Optional[Tuple]:
+        """Fingerprint of a single node and its eras, or None if the node is missing."""
+        fingerprint = await VersionRepository._fingerprint(
+            session,
+            [
+                (TeamNode, TeamNode.node_id == node_id),
+                (TeamEra, TeamEra.node_id == node_id),
+            ],
+        )
+        node_count = fingerprint[0]
+        return fingerprint if node_count else None
+
+    @staticmethod
+    async def _fingerprint(session: AsyncSession, sources: Sequence) -> Tuple:
+        columns = []
+        for model, criterion in sources:
+            count_stmt = select(func.count()).select_from(model)
+            max_stmt = select(func.max(model.updated_at))
+            if criterion is not None:
+                count_stmt = count_stmt.where(criterion)
+                max_stmt = max_stmt.where(criterion)
+            columns.append(count_stmt.scalar_subquery())
+            columns.append(max_stmt.scalar_subquery())
+        row = (await session.execute(select(*columns))).one()
+        return tuple(row)
@@ -44,6 +44,7 @@ class TeamNodeWithEras(TeamNodeResponse):
 
 class TeamListResponse(BaseModel):
     items: List[TeamNodeResponse]
-    total: int
+    total: Optional[int]
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
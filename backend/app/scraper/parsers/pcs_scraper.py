@@ -7,6 +7,10 @@ from ..base import BaseScraper
 from ..models import ScrapedTeamData, ScraperResult
 
 
+# The team name comes from the page's <h1>; without one there is nothing to parse
+_H1_TAG = re.compile(r'<h1[\s>]', re.IGNORECASE)
+
+
 class PCScraper(BaseScraper):
     """Scraper for ProCyclingStats.com."""
     
@@ -68,6 +72,10 @@ class PCScraper(BaseScraper):
         Returns:
             ScrapedTeamData or None if parsing fails
         """
+        # Skip building a soup for empty or h1-less (error/garbage) pages
+        if not html or not _H1_TAG.search(html):
+            return None
+        
         try:
             soup = BeautifulSoup(html, 'html.parser')
             
@@ -1,5 +1,5 @@
 import asyncio
-from datetime import datetime
+from time import monotonic
 from collections import defaultdict
 
 
@@ -15,10 +15,11 @@ class RateLimiter:
         """Wait if last request to domain was too recent"""
         async with self._locks[domain]:
             last_time = self.last_request_time[domain]
-            if last_time:
-                elapsed = (datetime.now() - last_time).total_seconds()
+            if last_time is not None:
+                # Monotonic seconds, so wall-clock adjustments can't skew the delay
+                elapsed = monotonic() - last_time
                 if elapsed < self.min_delay:
                     wait_time = self.min_delay - elapsed
                     await asyncio.sleep(wait_time)
 
-            self.last_request_time[domain] = datetime.now()
+            self.last_request_time[domain] = monotonic()
@@ -1,5 +1,9 @@
-from google.oauth2 import id_token
-from google.auth.transport import requests
+import asyncio
+import logging
+import httpx
+from cachetools import TTLCache
+from google.auth import jwt as google_jwt
+from jose import JWTError, jwt
 from typing import Optional, Dict
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -10,16 +14,52 @@ from app.core.security import create_access_token, create_refresh_token, hash_to
 from app.models.user import User, RefreshToken
 from app.schemas.auth import TokenResponse
 
+logger = logging.getLogger(__name__)
+
+# Google's ID token signing certificates, keyed by key id
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+_google_certs: TTLCache = TTLCache(maxsize=1, ttl=3600)
+# Set for a minute after each fetch; while set, unknown key ids don't refetch
+_google_certs_recent: TTLCache = TTLCache(maxsize=1, ttl=60)
+_google_certs_lock = asyncio.Lock()
+# Created on first use and dropped at app shutdown, so each lifespan (and
+# event loop) gets its own client
+_google_http: Optional[httpx.AsyncClient] = None
+
+
+def _get_google_http() -> httpx.AsyncClient:
+    global _google_http
+    if _google_http is None or _google_http.is_closed:
+        _google_http = httpx.AsyncClient(timeout=10.0)
+    return _google_http
+
+
+async def close_google_http() -> None:
+    """Close the shared client used to fetch Google's certs (app shutdown)."""
+    global _google_http
+    client, _google_http = _google_http, None
+    if client is not None:
+        await client.aclose()
+
+
+def _cached_google_certs(kid: Optional[str]) -> Optional[Dict[str, str]]:
+    certs = _google_certs.get("certs")
+    if certs is not None and (kid in certs or "fetched" in _google_certs_recent):
+        return certs
+    return None
+
 
 class AuthService:
     @staticmethod
     async def verify_google_token(token: str) -> Optional[Dict]:
         """Verify Google ID token and extract user info"""
         try:
-            idinfo = id_token.verify_oauth2_token(
+            certs = await AuthService._get_google_certs(token)
+            # Signature check is local CPU work against the cached certs
+            idinfo = google_jwt.decode(
                 token,
-                requests.Request(),
-                settings.GOOGLE_CLIENT_ID,
+                certs=certs,
+                audience=settings.GOOGLE_CLIENT_ID,
                 clock_skew_in_seconds=10  # Allow 10 seconds clock skew
             )
             
@@ -33,9 +73,41 @@ class AuthService:
                 'avatar_url': idinfo.get('picture')
             }
         except ValueError as e:
-            print(f"Token verification failed: {e}")
+            logger.warning("Token verification failed: %s", e)
+            return None
+        except httpx.HTTPError as e:
+            # Google being unreachable is a failed login, not a server error
+            logger.warning("Fetching Google certs failed: %s", e)
             return None
     
+    @staticmethod
+    async def _get_google_certs(token: str) -> Dict[str, str]:
+        """Return Google's signing certs, fetching them without blocking the loop.
+
+        Certs are cached for an hour and refetched early when the token was
+        signed with a key id we haven't seen (Google rotated its keys). Such
+        refetches happen at most once a minute, so tokens with junk key ids
+        can't drive outbound traffic, and concurrent callers share one fetch.
+        """
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except JWTError as e:
+            raise ValueError(f"Malformed token: {e}") from e
+
+        certs = _cached_google_certs(kid)
+        if certs is not None:
+            return certs
+        async with _google_certs_lock:
+            # Another caller may have fetched while we waited for the lock
+            certs = _cached_google_certs(kid)
+            if certs is None:
+                response = await _get_google_http().get(GOOGLE_CERTS_URL)
+                response.raise_for_status()
+                certs = response.json()
+                _google_certs["certs"] = certs
+                _google_certs_recent["fetched"] = True
+        return certs
+
     @staticmethod
     async def get_or_create_user(
         session: AsyncSession,
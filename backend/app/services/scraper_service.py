@@ -1,5 +1,5 @@
 """Service layer for scraper operations."""
-from typing import Optional
+from typing import Optional, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -8,6 +8,9 @@ from ..models.sponsor import SponsorMaster, SponsorBrand
 from ..scraper.models import ScrapedTeamData
 
 
+_TIER_LEVELS = {"WT": 1, "PT": 2, "CT": 3}
+
+
 class ScraperService:
     """Service for integrating scraped data into the database."""
     
@@ -32,6 +35,43 @@ class ScraperService:
             without full lineage tracking. Complete implementation would need
             to handle node creation, era management, and lineage events.
         """
+        era = self._build_era(data)
+        self.db.add(era)
+        
+        # Commit changes
+        await self.db.commit()
+        await self.db.refresh(era)
+        
+        return era
+    
+    async def upsert_scraped_data_batch(
+        self,
+        items: Sequence[ScrapedTeamData]
+    ) -> list[TeamEra]:
+        """
+        Insert several scraped teams with a single flush and commit.
+        
+        Every item is validated before anything is added, so one bad item
+        leaves the session untouched. Nodes and eras are each written as one
+        batched INSERT.
+        
+        Args:
+            items: Scraped team data, one per team
+        
+        Returns:
+            New TeamEra instances, in input order
+        
+        Raises:
+            ValueError: If any item is missing team_name
+        """
+        eras = [self._build_era(data) for data in items]
+        self.db.add_all(eras)
+        await self.db.commit()
+        return eras
+    
+    @staticmethod
+    def _build_era(data: ScrapedTeamData) -> TeamEra:
+        """Build an unsaved TeamEra (and its TeamNode) from scraped data."""
         if not data.team_name:
             raise ValueError("team_name is required")
         
@@ -41,19 +81,17 @@ class ScraperService:
         # 2. Handle multi-year team tracking
         # 3. Manage lineage events
         
-        # Simplified: Create new node and era
+        # Simplified: Create new node and era; the relationship lets the
+        # flush insert the node first and fill in node_id
         node = TeamNode(founding_year=2024)
-        self.db.add(node)
-        await self.db.flush()  # Get node_id
         
         # Convert tier string to tier_level integer
         tier_level = None
         if data.tier:
-            tier_map = {"WT": 1, "PT": 2, "CT": 3}
-            tier_level = tier_map.get(data.tier)
+            tier_level = _TIER_LEVELS.get(data.tier)
         
-        era = TeamEra(
-            node_id=node.node_id,
+        return TeamEra(
+            node=node,
             season_year=2024,
             registered_name=data.team_name,
             uci_code=data.uci_code,
@@ -61,13 +99,6 @@ class ScraperService:
             source_origin=data.source,
             is_manual_override=False
         )
-        self.db.add(era)
-        
-        # Commit changes
-        await self.db.commit()
-        await self.db.refresh(era)
-        
-        return era
     
     async def handle_sponsors(
         self,
@@ -1,15 +1,14 @@
 """Service layer for sponsor-related operations."""
 import uuid
-from typing import Optional, Dict, List
+from collections import defaultdict
+from typing import Optional, Dict, List, Sequence
 
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.models.sponsor import SponsorMaster, SponsorBrand, TeamSponsorLink
 from app.models.team import TeamEra
 from app.core.exceptions import ValidationException, NodeNotFoundException
-from app.services.timeline_service import TimelineService
 
 
 class SponsorService:
@@ -195,10 +194,64 @@ class SponsorService:
         )
         session.add(link)
         await session.flush()
-        # Invalidate timeline cache after data change
-        TimelineService.invalidate_cache()
         return link
 
+    @staticmethod
+    async def bulk_create(
+        session: AsyncSession,
+        *,
+        masters: Sequence[SponsorMaster] = (),
+        brands: Sequence[SponsorBrand] = (),
+        links: Sequence[TeamSponsorLink] = (),
+    ) -> None:
+        """Add many sponsor masters, brands and era links with a single flush.
+
+        Brands and links may point at objects from the same batch through their
+        ``master``/``brand`` relationships, since ids are only assigned on
+        flush; links must carry an ``era_id``. Field validators on the models
+        still apply and uniqueness is enforced by the database constraints.
+
+        Args:
+            session: Database session
+            masters: New SponsorMaster instances
+            brands: New SponsorBrand instances
+            links: New TeamSponsorLink instances
+
+        Raises:
+            ValidationException: If a name is empty or an era's prominence
+                (existing plus new links) would exceed 100%
+        """
+        for master in masters:
+            if not master.legal_name or not master.legal_name.strip():
+                raise ValidationException("legal_name cannot be empty")
+        for brand in brands:
+            if not brand.brand_name or not brand.brand_name.strip():
+                raise ValidationException("brand_name cannot be empty")
+
+        added: Dict[uuid.UUID, int] = defaultdict(int)
+        for link in links:
+            added[link.era_id] += link.prominence_percent
+        if added:
+            # One grouped query covers every era touched by the batch; nothing
+            # from the batch may be flushed before it has been validated
+            with session.no_autoflush:
+                result = await session.execute(
+                    select(TeamSponsorLink.era_id, func.sum(TeamSponsorLink.prominence_percent))
+                    .where(TeamSponsorLink.era_id.in_(added))
+                    .group_by(TeamSponsorLink.era_id)
+                )
+            existing = dict(result.all())
+            for era_id, percent in added.items():
+                current_total = existing.get(era_id) or 0
+                if current_total + percent > 100:
+                    raise ValidationException(
+                        f"Adding {percent}% would exceed 100% total "
+                        f"(current total: {current_total}%)"
+                    )
+
+        session.add_all([*masters, *brands, *links])
+        await session.flush()
+
     @staticmethod
     async def validate_era_sponsors(
         session: AsyncSession,
@@ -257,29 +310,61 @@ class SponsorService:
         Raises:
             NodeNotFoundException: If era_id doesn't exist
         """
-        result = await session.execute(
-            select(TeamEra).where(TeamEra.era_id == era_id)
-        )
-        era = result.scalar_one_or_none()
-        if not era:
-            raise NodeNotFoundException(f"TeamEra with id {era_id} not found")
+        # One outer-join query both checks the era exists and loads its brands
+        era_id = uuid.UUID(str(era_id))
+        compositions = await SponsorService.get_compositions_bulk(session, [era_id])
+        return compositions[era_id]
+
+    @staticmethod
+    async def get_compositions_bulk(
+        session: AsyncSession,
+        era_ids: Sequence[uuid.UUID]
+    ) -> Dict[uuid.UUID, List[Dict[str, any]]]:
+        """Get jersey compositions for several eras in a single query.
         
+        Args:
+            session: Database session
+            era_ids: UUIDs of TeamEras
+            
+        Returns:
+            Dict mapping each era_id to the same list that
+            get_era_jersey_composition returns (empty for unsponsored eras)
+            
+        Raises:
+            NodeNotFoundException: If any era_id doesn't exist
+        """
+        # Result keys are UUIDs from the database; str ids must compare equal
+        era_ids = [uuid.UUID(str(era_id)) for era_id in era_ids]
+        # Outer joins keep eras without links so missing eras can be detected
         result = await session.execute(
-            select(TeamSponsorLink, SponsorBrand)
-            .join(SponsorBrand, TeamSponsorLink.brand_id == SponsorBrand.brand_id)
-            .where(TeamSponsorLink.era_id == era_id)
-            .order_by(TeamSponsorLink.rank_order)
-            .options(selectinload(TeamSponsorLink.brand))
+            select(
+                TeamEra.era_id,
+                SponsorBrand.brand_name,
+                SponsorBrand.default_hex_color,
+                TeamSponsorLink.prominence_percent,
+                TeamSponsorLink.rank_order,
+            )
+            .select_from(TeamEra)
+            .outerjoin(TeamSponsorLink, TeamSponsorLink.era_id == TeamEra.era_id)
+            .outerjoin(SponsorBrand, TeamSponsorLink.brand_id == SponsorBrand.brand_id)
+            .where(TeamEra.era_id.in_(era_ids))
+            .order_by(TeamEra.era_id, TeamSponsorLink.rank_order)
         )
-        rows = result.all()
         
-        composition = []
-        for link, brand in rows:
-            composition.append({
-                'brand_name': brand.brand_name,
-                'color': brand.default_hex_color,
-                'prominence_percent': link.prominence_percent,
-                'rank_order': link.rank_order
-            })
+        compositions: Dict[uuid.UUID, List[Dict[str, any]]] = {}
+        for era_id, brand_name, color, prominence, rank_order in result.all():
+            composition = compositions.setdefault(era_id, [])
+            if rank_order is not None:
+                composition.append({
+                    'brand_name': brand_name,
+                    'color': color,
+                    'prominence_percent': prominence,
+                    'rank_order': rank_order
+                })
         
-        return composition
+        missing = set(era_ids) - compositions.keys()
+        if missing:
+            raise NodeNotFoundException(
+                f"TeamEra with id {next(iter(missing))} not found"
+            )
+        return compositions
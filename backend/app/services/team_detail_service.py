@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
+from itertools import chain
 from typing import List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -40,15 +41,42 @@ class TeamDetailService:
             return None
 
         eras_sorted = sorted(team.eras, key=lambda e: e.season_year)
-        current_year = datetime.utcnow().year
+        current_year = datetime.now(timezone.utc).year
+
+        # Resolve each neighbouring node's display name once, not per era
+        prev_latest_name = {
+            e.previous_node_id: max(e.previous_node.eras, key=lambda x: x.season_year).registered_name
+            for e in team.incoming_events
+            if e.previous_node and e.previous_node.eras
+        }
+        next_earliest_name = {
+            e.next_node_id: min(e.next_node.eras, key=lambda x: x.season_year).registered_name
+            for e in team.outgoing_events
+            if e.next_node and e.next_node.eras
+        }
+
+        predecessors = TeamDetailService._match_predecessor_events(eras_sorted, team.incoming_events)
+        successors = TeamDetailService._match_successor_events(eras_sorted, team.outgoing_events)
 
         timeline: List[TeamHistoryEra] = []
-        for era in eras_sorted:
+        for era, prev_event, next_event in zip(eras_sorted, predecessors, successors):
             status = TeamDetailService.calculate_era_status(
                 era, current_year, team.dissolution_year
             )
-            predecessor = TeamDetailService._find_predecessor_event(team, era)
-            successor = TeamDetailService._find_successor_event(team, era)
+            predecessor = (
+                TeamDetailService._event_to_transition(
+                    prev_event, prev_latest_name.get(prev_event.previous_node_id, "")
+                )
+                if prev_event
+                else None
+            )
+            successor = (
+                TeamDetailService._event_to_transition(
+                    next_event, next_earliest_name.get(next_event.next_node_id, "")
+                )
+                if next_event
+                else None
+            )
             timeline.append(
                 TeamHistoryEra(
                     year=era.season_year,
@@ -64,8 +92,10 @@ class TeamDetailService:
         lineage_summary = LineageSummary(
             has_predecessors=len(team.incoming_events) > 0,
             has_successors=len(team.outgoing_events) > 0,
-            spiritual_succession=any(e.event_type == EventType.SPIRITUAL_SUCCESSION for e in team.incoming_events)
-            or any(e.event_type == EventType.SPIRITUAL_SUCCESSION for e in team.outgoing_events),
+            spiritual_succession=any(
+                e.event_type == EventType.SPIRITUAL_SUCCESSION
+                for e in chain(team.incoming_events, team.outgoing_events)
+            ),
         )
 
         return TeamHistoryResponse(
@@ -82,11 +112,7 @@ class TeamDetailService:
     ) -> str:
         if dissolution_year is not None and era.season_year >= dissolution_year:
             return "dissolved"
-        if era.season_year == current_year and dissolution_year is None:
-            return "active"
-        if era.season_year < current_year:
-            return "historical"
-        return "active"
+        return "historical" if era.season_year < current_year else "active"
 
     @staticmethod
     def _event_to_transition(event: LineageEvent, name: str) -> TransitionInfo:
@@ -109,27 +135,41 @@ class TeamDetailService:
         return str(event.event_type)
 
     @staticmethod
-    def _find_predecessor_event(team: TeamNode, era: TeamEra) -> Optional[TransitionInfo]:
-        # predecessor: incoming event targeting this node with same or previous year
-        candidates = [e for e in team.incoming_events if e.event_year <= era.season_year]
-        if not candidates:
-            return None
-        event = max(candidates, key=lambda e: e.event_year)
-        name = None
-        if event.previous_node and event.previous_node.eras:
-            prev_eras = sorted(event.previous_node.eras, key=lambda x: x.season_year)
-            name = prev_eras[-1].registered_name
-        return TeamDetailService._event_to_transition(event, name or "")
+    def _match_predecessor_events(
+        eras_sorted: List[TeamEra], incoming_events: List[LineageEvent]
+    ) -> List[Optional[LineageEvent]]:
+        """For each era (ascending by year), the latest incoming event at or before it.
+
+        Sweeps eras and year-sorted events together in a single forward pass;
+        on equal years the first event keeps precedence.
+        """
+        events = sorted(incoming_events, key=lambda e: e.event_year)
+        matched: List[Optional[LineageEvent]] = []
+        current: Optional[LineageEvent] = None
+        j = 0
+        for era in eras_sorted:
+            while j < len(events) and events[j].event_year <= era.season_year:
+                if current is None or events[j].event_year > current.event_year:
+                    current = events[j]
+                j += 1
+            matched.append(current)
+        return matched
 
     @staticmethod
-    def _find_successor_event(team: TeamNode, era: TeamEra) -> Optional[TransitionInfo]:
-        # successor: outgoing event from this node after or at era year
-        candidates = [e for e in team.outgoing_events if e.event_year >= era.season_year]
-        if not candidates:
-            return None
-        event = min(candidates, key=lambda e: e.event_year)
-        name = None
-        if event.next_node and event.next_node.eras:
-            next_eras = sorted(event.next_node.eras, key=lambda x: x.season_year)
-            name = next_eras[0].registered_name
-        return TeamDetailService._event_to_transition(event, name or "")
+    def _match_successor_events(
+        eras_sorted: List[TeamEra], outgoing_events: List[LineageEvent]
+    ) -> List[Optional[LineageEvent]]:
+        """For each era (ascending by year), the earliest outgoing event at or after it.
+
+        Mirrors _match_predecessor_events with a single backward pass.
+        """
+        events = sorted(outgoing_events, key=lambda e: e.event_year)
+        matched: List[Optional[LineageEvent]] = [None] * len(eras_sorted)
+        current: Optional[LineageEvent] = None
+        k = len(events)
+        for i in range(len(eras_sorted) - 1, -1, -1):
+            while k > 0 and events[k - 1].event_year >= eras_sorted[i].season_year:
+                k -= 1
+                current = events[k]
+            matched[i] = current
+        return matched
@@ -4,7 +4,8 @@ from __future__ import annotations
 from typing import List, Optional
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import select, exists
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -14,8 +15,8 @@ from app.core.exceptions import (
     DuplicateEraException,
     ValidationException,
 )
-from app.services.timeline_service import TimelineService
 from app.repositories.team_repository import TeamRepository
+from app.core.pagination import encode_cursor, decode_cursor
 
 
 class TeamService:
@@ -53,21 +54,31 @@ class TeamService:
         limit: int = 50,
         active_in_year: Optional[int] = None,
         tier_level: Optional[int] = None,
-    ) -> tuple[List[TeamNode], int]:
+        cursor: Optional[str] = None,
+        with_total: bool = True,
+    ) -> tuple[List[TeamNode], Optional[int], Optional[str]]:
+        """Return a page of nodes, the filtered total and the next page's cursor."""
+        after = decode_cursor(cursor) if cursor else None
         # Use repository to handle filtering, pagination, and eager-loading
-        nodes, total = await TeamRepository.get_all(
+        nodes, total, has_more = await TeamRepository.get_all(
             session,
             skip=skip,
             limit=limit,
             active_in_year=active_in_year,
             tier_level=tier_level,
+            after=after,
+            with_total=with_total,
         )
         # Defensive: ensure eras are attached to each node to avoid async lazy-loads later
         for n in nodes:
             if 'eras' not in n.__dict__:
                 eras = await TeamRepository.get_eras_for_node(session, n.node_id)
                 n.__dict__['eras'] = eras
-        return nodes, total
+        next_cursor = None
+        if has_more:
+            last = nodes[-1]
+            next_cursor = encode_cursor(last.founding_year, last.node_id)
+        return nodes, total, next_cursor
 
     @staticmethod
     async def get_node_eras(
@@ -105,20 +116,19 @@ class TeamService:
         if not registered_name or registered_name.strip() == "":
             raise ValidationException("registered_name cannot be empty")
 
-        # Ensure node exists (DB I/O begins here)
-        node_stmt = select(TeamNode).where(TeamNode.node_id == node_id)
-        node_result = await session.execute(node_stmt)
-        node = node_result.scalar_one_or_none()
-        if not node:
+        # Ensure node exists and the year is free (DB I/O begins here); both
+        # existence probes go out in a single round trip
+        probe_stmt = select(
+            exists().where(TeamNode.node_id == node_id).label("node_exists"),
+            exists()
+            .where(TeamEra.node_id == node_id, TeamEra.season_year == year)
+            .label("era_exists"),
+        )
+        node_exists, era_exists = (await session.execute(probe_stmt)).one()
+        if not node_exists:
             await session.rollback()
             raise NodeNotFoundException(f"TeamNode {node_id} not found")
-
-        # Duplicate check
-        dup_stmt = select(TeamEra).where(
-            TeamEra.node_id == node_id, TeamEra.season_year == year
-        )
-        dup_result = await session.execute(dup_stmt)
-        if dup_result.scalar_one_or_none():
+        if era_exists:
             await session.rollback()
             raise DuplicateEraException(
                 f"Era for node {node_id} and year {year} already exists"
@@ -134,8 +144,13 @@ class TeamService:
             is_manual_override=is_manual_override,
         )
         session.add(era)
-        await session.commit()
-        # Invalidate timeline cache after data change
-        TimelineService.invalidate_cache()
+        # uq_node_year still catches an era inserted concurrently after the probe
+        try:
+            await session.commit()
+        except IntegrityError as exc:
+            await session.rollback()
+            raise DuplicateEraException(
+                f"Era for node {node_id} and year {year} already exists"
+            ) from exc
         await session.refresh(era)
         return era
@@ -1,23 +1,158 @@
-from typing import Dict, List, Optional, Tuple
-import time
+import asyncio
+import logging
+import weakref
+from itertools import chain
+from typing import Dict, List, Optional, Set, Tuple
+import orjson
+from cachetools import TTLCache
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, selectinload
 from app.models.team import TeamNode, TeamEra
 from app.models.lineage import LineageEvent
+from app.models.sponsor import SponsorBrand, TeamSponsorLink
 from app.repositories.timeline_repository import TimelineRepository
+from app.repositories.version_repository import VersionRepository
 from app.core.graph_builder import GraphBuilder
 from app.core.config import settings
+from app.core.etag import compute_version_etag
 
+logger = logging.getLogger(__name__)
 
-class TimelineService:
-    # Simple in-memory cache: key -> (expires_at, value)
-    _cache: Dict[str, Tuple[float, Dict]] = {}
-    _CACHE_TTL_SECONDS: int = 300  # 5 minutes
+# Every live TimelineCache, so commits invalidate injected caches too
+_caches: "weakref.WeakSet[TimelineCache]" = weakref.WeakSet()
+
+
+class TimelineCache:
+    """Process-wide store for built timeline graphs.
+
+    Holds the bounded in-process TTL caches, the single-flight map of builds in
+    progress and the optional Redis tier shared across workers. A single
+    module-level instance is shared by all TimelineService objects; tests and
+    callers may pass their own instance instead.
+
+    When Redis is configured the in-process caches are bypassed: an
+    invalidation in one worker could not clear them in the others. Shared
+    entries are keyed by a generation counter kept in Redis, which every
+    invalidation bumps, so a build that started before a commit in any
+    worker writes to a key that is no longer read.
+    """
+
+    # Bump when the cached payload shape changes so stale shared entries are ignored
+    VERSION: int = 1
+    GENERATION_KEY = "timeline:generation"
+
+    def __init__(self, maxsize: int, ttl: int, redis: Optional[aioredis.Redis] = None):
+        # Entries expire after the TTL and the least recently used ones are
+        # evicted once maxsize is reached.
+        self.local: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Serialized JSON body and ETag per key, so hits skip re-encoding
+        self.rendered: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.ttl = ttl
+        # Builds currently in progress, so concurrent misses share one query
+        self.inflight: Dict[str, asyncio.Future] = {}
+        # Bumped on invalidation so builds started earlier don't repopulate the cache
+        self.generation = 0
+        self._redis = redis
+        self._purge_tasks: Set[asyncio.Task] = set()
+        _caches.add(self)
+
+    def get_redis(self) -> Optional[aioredis.Redis]:
+        """Return the shared Redis client, or None when the shared tier is disabled."""
+        if not settings.TIMELINE_CACHE_ENABLED:
+            return None
+        if self._redis is None and settings.REDIS_URL:
+            self._redis = aioredis.from_url(settings.REDIS_URL)
+        return self._redis
+
+    def clear(self) -> None:
+        """Drop all process-local entries and pending builds."""
+        self.local.clear()
+        self.rendered.clear()
+        self.inflight.clear()
+
+    def invalidate(self) -> None:
+        """Clear local state and schedule a purge of the shared tier."""
+        self.generation += 1
+        self.clear()
+
+        redis = self.get_redis()
+        if redis is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning("No running event loop; shared timeline cache not purged")
+            return
+        task = loop.create_task(self._invalidate_shared(redis))
+        self._purge_tasks.add(task)
+        task.add_done_callback(self._purge_tasks.discard)
+
+    async def wait_for_purges(self) -> None:
+        """Wait for scheduled shared-tier purges to finish."""
+        if self._purge_tasks:
+            await asyncio.gather(*self._purge_tasks)
+
+    async def shared_key(self, redis: aioredis.Redis, cache_key: str) -> str:
+        """Return the Redis key for ``cache_key`` under the current shared generation."""
+        generation = await redis.get(self.GENERATION_KEY)
+        return f"{cache_key}|gen:{int(generation or 0)}"
+
+    async def _invalidate_shared(self, redis: aioredis.Redis) -> None:
+        try:
+            await redis.incr(self.GENERATION_KEY)
+            # Entries of older generations are never read again; drop them early
+            async for key in redis.scan_iter(match=f"timeline:v{self.VERSION}|*"):
+                await redis.delete(key)
+        except RedisError as exc:
+            logger.warning("Timeline shared cache purge failed: %s", exc)
+
+
+timeline_cache = TimelineCache(
+    maxsize=settings.TIMELINE_CACHE_MAX_ENTRIES,
+    ttl=settings.TIMELINE_CACHE_TTL_SECONDS,
+)
+
+def invalidate_all_caches() -> None:
+    """Invalidate every live TimelineCache, including injected ones."""
+    for cache in list(_caches):
+        cache.invalidate()
 
-    def __init__(self, session: AsyncSession):
+
+# Models whose rows end up in the timeline graph
+_TIMELINE_MODELS = (TeamNode, TeamEra, LineageEvent, TeamSponsorLink, SponsorBrand)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_timeline_changes(session: Session, flush_context) -> None:
+    # new/dirty/deleted still describe the flushed changes at this point
+    if any(
+        isinstance(obj, _TIMELINE_MODELS)
+        for obj in chain(session.new, session.dirty, session.deleted)
+    ):
+        session.info["timeline_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_timeline_on_commit(session: Session) -> None:
+    # Any committed write to timeline data invalidates cached graphs, so
+    # services don't each have to remember to do it
+    if session.info.pop("timeline_changed", False):
+        invalidate_all_caches()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_timeline_changes(session: Session) -> None:
+    session.info.pop("timeline_changed", None)
+
+
+class TimelineService:
+    def __init__(self, session: AsyncSession, cache: Optional[TimelineCache] = None):
         self.session = session
         self.builder = GraphBuilder()
+        self.cache = cache if cache is not None else timeline_cache
 
     async def get_graph_data(
         self,
@@ -26,6 +161,93 @@ class TimelineService:
         include_dissolved: bool,
         tier_filter: Optional[List[int]] = None,
     ) -> Dict:
+        cache_key = self._cache_key(start_year, end_year, include_dissolved, tier_filter)
+
+        # Hits return the final graph dict; GraphBuilder and the ORM are never
+        # touched on this path.
+        use_local = self._use_local_cache()
+        if use_local:
+            cached = self.cache.local.get(cache_key)
+            if cached is not None:
+                logger.debug("Returning cached timeline data")
+                return cached
+
+        inflight = self.cache.inflight.get(cache_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self.cache.inflight[cache_key] = future
+        generation = self.cache.generation
+        try:
+            result = await self._load_graph_data(
+                cache_key, start_year, end_year, include_dissolved, tier_filter
+            )
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark the exception as retrieved when no other request was waiting
+            future.exception()
+            raise
+        finally:
+            if self.cache.inflight.get(cache_key) is future:
+                del self.cache.inflight[cache_key]
+
+        future.set_result(result)
+        if use_local and generation == self.cache.generation:
+            self.cache.local[cache_key] = result
+        return result
+
+    async def get_graph_json(
+        self,
+        start_year: int,
+        end_year: int,
+        include_dissolved: bool,
+        tier_filter: Optional[List[int]] = None,
+        if_none_match: Optional[str] = None,
+    ) -> Tuple[Optional[bytes], str]:
+        """Return the graph as a serialized JSON body together with its ETag.
+
+        The ETag is derived from a data fingerprint, so when it matches
+        ``if_none_match`` the body is not built and None is returned instead.
+        """
+        cache_key = self._cache_key(start_year, end_year, include_dissolved, tier_filter)
+        use_local = self._use_local_cache()
+        if use_local:
+            rendered = self.cache.rendered.get(cache_key)
+            if rendered is not None:
+                return rendered
+
+        generation = self.cache.generation
+        # Fingerprint before building so a concurrent write can only make the
+        # ETag older than the body, never newer
+        fingerprint = await VersionRepository.timeline_fingerprint(self.session)
+        etag = compute_version_etag(cache_key, *fingerprint)
+        if if_none_match == etag:
+            return None, etag
+
+        data = await self.get_graph_data(
+            start_year, end_year, include_dissolved, tier_filter
+        )
+        body = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        rendered = (body, etag)
+        if use_local and generation == self.cache.generation:
+            self.cache.rendered[cache_key] = rendered
+        return rendered
+
+    def _use_local_cache(self) -> bool:
+        # Only the Redis tier is visible to other workers' invalidations
+        return settings.TIMELINE_CACHE_ENABLED and self.cache.get_redis() is None
+
+    def _cache_key(
+        self,
+        start_year: int,
+        end_year: int,
+        include_dissolved: bool,
+        tier_filter: Optional[List[int]],
+    ) -> str:
         # Cache key based on query parameters
         key_parts = [
             f"start:{start_year}",
@@ -33,35 +255,64 @@ class TimelineService:
             f"dissolved:{include_dissolved}",
             f"tiers:{','.join(map(str, tier_filter))}" if tier_filter else "tiers:"
         ]
-        cache_key = "timeline:" + "|".join(key_parts)
+        return f"timeline:v{self.cache.VERSION}|" + "|".join(key_parts)
+
+    async def _load_graph_data(
+        self,
+        cache_key: str,
+        start_year: int,
+        end_year: int,
+        include_dissolved: bool,
+        tier_filter: Optional[List[int]],
+    ) -> Dict:
+        redis = self.cache.get_redis()
+        shared_key = None
+        if redis is not None:
+            try:
+                # Resolved before building, so a concurrent invalidation moves
+                # readers off the key this build writes to
+                shared_key = await self.cache.shared_key(redis, cache_key)
+                cached = await redis.get(shared_key)
+                if cached is not None:
+                    return orjson.loads(cached)
+            except RedisError as exc:
+                logger.warning("Timeline shared cache read failed: %s", exc)
+
+        result = await self._build_graph_data(
+            start_year, end_year, include_dissolved, tier_filter
+        )
+
+        if shared_key is not None:
+            try:
+                await redis.set(
+                    shared_key, orjson.dumps(result), ex=self.cache.ttl
+                )
+            except RedisError as exc:
+                logger.warning("Timeline shared cache write failed: %s", exc)
+        return result
 
-        now = time.time()
-        if settings.TIMELINE_CACHE_ENABLED:
-            cached = self._cache.get(cache_key)
-            if cached and cached[0] > now:
-                print(f"DEBUG: Returning cached timeline data")
-                return cached[1]
-        
-        print(f"DEBUG: Cache miss or disabled, building fresh timeline data")
+    async def _build_graph_data(
+        self,
+        start_year: int,
+        end_year: int,
+        include_dissolved: bool,
+        tier_filter: Optional[List[int]],
+    ) -> Dict:
+        logger.debug("Cache miss or disabled, building fresh timeline data")
 
         repo = TimelineRepository()
         eras, events = await repo.fetch_eras_and_events(
             self.session,
-            year=None,  # we'll filter by range below
-            tier=None,
+            start_year=start_year,
+            end_year=end_year,
+            tiers=tier_filter,
+            include_dissolved=include_dissolved,
         )
 
-        # Build team nodes from eras, applying filters and dissolved policy
-        # Group eras by node
+        # Group the (already filtered) eras by node
         nodes_by_id: Dict[str, TeamNode] = {}
         for era in eras:
-            if not (start_year <= era.season_year <= end_year):
-                continue
-            if tier_filter is not None and era.tier_level not in tier_filter:
-                continue
             node = era.node
-            if not include_dissolved and node.dissolution_year is not None and node.dissolution_year <= end_year:
-                continue
             if str(node.node_id) not in nodes_by_id:
                 nodes_by_id[str(node.node_id)] = node
                 # Avoid triggering lazy load when clearing eras
@@ -69,9 +320,6 @@ class TimelineService:
             nodes_by_id[str(node.node_id)].eras.append(era)
         teams = list(nodes_by_id.values())
 
-        # Filter events to range
-        events = [e for e in events if (start_year <= e.event_year <= end_year)]
-
         nodes = self.builder.build_nodes(teams)
         links = self.builder.build_links(events)
 
@@ -80,14 +328,9 @@ class TimelineService:
             "node_count": len(nodes),
             "link_count": len(links),
         }
-        result = {"nodes": nodes, "links": links, "meta": meta}
-        # Store in cache
-        if settings.TIMELINE_CACHE_ENABLED:
-            ttl = getattr(settings, "TIMELINE_CACHE_TTL_SECONDS", self._CACHE_TTL_SECONDS)
-            self._cache[cache_key] = (now + ttl, result)
-        return result
+        return {"nodes": nodes, "links": links, "meta": meta}
 
     @classmethod
     def invalidate_cache(cls) -> None:
         """Invalidate all cached timeline results."""
-        cls._cache.clear()
+        invalidate_all_caches()
@@ -0,0 +1,8 @@
+"""Pytest configuration and fixtures shared by every test directory."""
+
+pytest_plugins = [
+    "tests.fixtures.db",
+    "tests.fixtures.client",
+    "tests.fixtures.data",
+    "tests.fixtures.users",
+]
@@ -0,0 +1,25 @@
+"""Gunicorn settings for production.
+
+Runs several uvicorn workers so requests are spread over more than one event
+loop (and more than one core). Workers pick uvloop and httptools
+automatically since both are installed.
+
+Usage: gunicorn -c gunicorn_conf.py main:app
+"""
+import multiprocessing
+import os
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}"
+
+# Async workers each saturate a core on their own, so one per core is the
+# default rather than the 2n+1 used for sync workers. Every worker opens its
+# own DB pool (DB_POOL_SIZE + DB_MAX_OVERFLOW), so keep
+# workers * pool within Postgres' max_connections.
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+# Heartbeat files on tmpfs so a slow disk can't stall workers
+worker_tmp_dir = "/dev/shm"
+
+# No access log: uvicorn skips access logging when the logger has no handlers
+accesslog = None
+loglevel = "warning"
@@ -1,6 +1,6 @@
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
 from app.core.config import settings
@@ -10,16 +10,18 @@ from app.api.v1.timeline import router as timeline_router
 from app.api.v1.admin import router as admin_router
 from app.api.v1.auth import router as auth_router
 from app.api.v1.edits import router as edits_router
+from app.services.auth_service import close_google_http
 from app.core.exceptions import (
     NodeNotFoundException,
     DuplicateEraException,
     ValidationException as DomainValidationException,
 )
-from app.db.database import create_tables
+import anyio
 import logging
+import orjson
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=settings.LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
 
@@ -30,21 +32,26 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     logger.info("Starting up application...")
+    # Raise AnyIO's default 40-thread cap for sync dependencies/endpoints
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_TOKENS
     # Note: We use Alembic migrations, so we don't call create_tables() here
     # Tables are created via: docker-compose run backend alembic upgrade head
     logger.info("Application startup complete - using Alembic migrations")
     
     yield
     
-    # Shutdown (if needed in future)
+    # Shutdown
     logger.info("Shutting down application...")
+    await close_google_http()
 
 
 app = FastAPI(
     title="ChainLines API",
     description="API for tracking professional cycling team history and lineage",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson encodes responses considerably faster than the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -52,8 +59,9 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=settings.CORS_ALLOW_METHODS,
+    allow_headers=settings.CORS_ALLOW_HEADERS,
+    max_age=settings.CORS_MAX_AGE,
 )
 
 
@@ -75,20 +83,22 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             error_dict["ctx"] = {k: str(v) for k, v in error["ctx"].items()}
         errors.append(error_dict)
     
-    return JSONResponse(
+    content = {"detail": errors}
+    # The raw request body can be large; only echo it back while debugging
+    if settings.DEBUG:
+        content["body"] = exc.body
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
-            "detail": errors,
-            "body": exc.body,
-        },
+        content=content,
     )
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions"""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    # Lazy %-formatting: the message is only built if the record is emitted
+    logger.exception("Unhandled exception: %s", exc)
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "Internal server error",
@@ -100,17 +110,17 @@ async def general_exception_handler(request: Request, exc: Exception):
 # Domain-specific exception handlers
 @app.exception_handler(NodeNotFoundException)
 async def node_not_found_handler(request: Request, exc: NodeNotFoundException):
-    return JSONResponse(status_code=exc.status_code, content=exc.to_dict())
+    return ORJSONResponse(status_code=exc.status_code, content=exc.to_dict())
 
 
 @app.exception_handler(DuplicateEraException)
 async def duplicate_era_handler(request: Request, exc: DuplicateEraException):
-    return JSONResponse(status_code=exc.status_code, content=exc.to_dict())
+    return ORJSONResponse(status_code=exc.status_code, content=exc.to_dict())
 
 
 @app.exception_handler(DomainValidationException)
 async def domain_validation_handler(request: Request, exc: DomainValidationException):
-    return JSONResponse(status_code=exc.status_code, content=exc.to_dict())
+    return ORJSONResponse(status_code=exc.status_code, content=exc.to_dict())
 
 
 # Include routers
@@ -124,11 +134,19 @@ from app.api.v1 import moderation
 app.include_router(moderation.router)
 
 
+# The root payload never changes, so it is encoded once at import
+_ROOT_BODY = orjson.dumps({
+    "status": "ok",
+    "message": "ChainLines API",
+    "version": "0.1.0"
+})
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "status": "ok",
-        "message": "ChainLines API",
-        "version": "0.1.0"
-    }
+    return Response(
+        content=_ROOT_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"},
+    )
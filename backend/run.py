@@ -0,0 +1,28 @@
+"""Single-process entrypoint for the API server (see gunicorn_conf.py for
+the multi-worker production setup).
+
+Pins uvicorn to the uvloop event loop and the httptools HTTP parser (both
+shipped with uvicorn[standard]) instead of relying on auto-detection.
+uvloop is not available on Windows, where the stdlib asyncio loop is used.
+"""
+import os
+import sys
+
+import uvicorn
+
+
+def main() -> None:
+    uvicorn.run(
+        "main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # Per-request access lines cost formatting and a write on every hit
+        access_log=False,
+        log_level="warning",
+    )
+
+
+if __name__ == "__main__":
+    main()
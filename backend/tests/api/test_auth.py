@@ -269,7 +269,6 @@ async def test_user(db_session):
     )
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
     return user
 
 
@@ -284,7 +283,6 @@ async def admin_user(db_session):
     )
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
     return user
 
 
@@ -301,5 +299,4 @@ async def banned_user(db_session):
     )
     db_session.add(user)
     await db_session.commit()
-    await db_session.refresh(user)
     return user
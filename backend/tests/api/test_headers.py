@@ -13,6 +13,9 @@ async def test_timeline_etag_and_304(test_client: AsyncClient):
 
     resp2 = await test_client.get("/api/v1/timeline", headers={"If-None-Match": etag})
     assert resp2.status_code == 304
+    assert resp2.content == b""
+    assert "content-type" not in resp2.headers
+    assert resp2.headers.get("etag") == etag
 
 async def test_teams_list_etag_and_304(test_client: AsyncClient):
     resp = await test_client.get("/api/v1/teams")
@@ -5,10 +5,19 @@ from app.models.team import TeamEra
 
 pytestmark = pytest.mark.asyncio
 
-async def test_timeline_etag_changes_on_data_mutation(test_client: AsyncClient, isolated_session: AsyncSession, sample_team_node):
-    r1 = await test_client.get("/api/v1/timeline")
+async def _assert_not_modified(asgi_call, url: str, etag: str):
+    """A revalidation with a still-current ETag must be a bodiless 304."""
+    resp = await asgi_call("GET", url, {"If-None-Match": etag})
+    assert resp.status == 304
+    assert resp.body == b""
+    assert resp.headers.get("etag") == etag
+
+async def test_timeline_etag_changes_on_data_mutation(test_client: AsyncClient, asgi_call, isolated_session: AsyncSession, sample_team_node):
+    url = "/api/v1/timeline?end_year=2100"
+    r1 = await test_client.get(url)
     etag1 = r1.headers.get("etag")
     assert etag1 is not None
+    await _assert_not_modified(asgi_call, url, etag1)
 
     # Mutate data: add a new era for the sample team
     new_era = TeamEra(node_id=sample_team_node.node_id, season_year=2099, registered_name="Future Team", tier_level=1)
@@ -19,18 +28,52 @@ async def test_timeline_etag_changes_on_data_mutation(test_client: AsyncClient,
     inv = await test_client.post("/api/v1/admin/cache/invalidate")
     assert inv.status_code in (200, 204)
 
-    # Request again with widened year range to include the new era
-    r2 = await test_client.get("/api/v1/timeline?end_year=2100")
+    # The old ETag no longer validates, so the full body comes back
+    r2 = await test_client.get(url, headers={"If-None-Match": etag1})
+    assert r2.status_code == 200
     etag2 = r2.headers.get("etag")
     assert etag2 is not None
     assert etag2 != etag1
 
-async def test_teams_list_etag_changes_on_pagination(test_client: AsyncClient):
+async def test_teams_list_etag_changes_on_pagination(test_client: AsyncClient, asgi_call):
     r1 = await test_client.get("/api/v1/teams?skip=0&limit=5")
     etag1 = r1.headers.get("etag")
     assert etag1 is not None
+    await _assert_not_modified(asgi_call, "/api/v1/teams?skip=0&limit=5", etag1)
 
-    r2 = await test_client.get("/api/v1/teams?skip=5&limit=5")
+    r2 = await test_client.get("/api/v1/teams?skip=5&limit=5", headers={"If-None-Match": etag1})
+    assert r2.status_code == 200
     etag2 = r2.headers.get("etag")
     assert etag2 is not None
     assert etag2 != etag1
+
+async def test_timeline_304_skips_graph_build(test_client: AsyncClient, sample_team_node, monkeypatch):
+    r1 = await test_client.get("/api/v1/timeline")
+    etag = r1.headers.get("etag")
+
+    from app.services.timeline_service import TimelineService
+
+    async def fail_build(self, *args, **kwargs):
+        raise AssertionError("graph should not be rebuilt for a matching ETag")
+
+    monkeypatch.setattr(TimelineService, "_build_graph_data", fail_build)
+    r2 = await test_client.get("/api/v1/timeline", headers={"If-None-Match": etag})
+    assert r2.status_code == 304
+    assert r2.headers.get("etag") == etag
+
+async def test_team_etag_changes_on_era_update(test_client: AsyncClient, isolated_session: AsyncSession, sample_team_node):
+    node_id = str(sample_team_node.node_id)
+    era = TeamEra(node_id=sample_team_node.node_id, season_year=2050, registered_name="Before", tier_level=1)
+    isolated_session.add(era)
+    await isolated_session.commit()
+
+    r1 = await test_client.get(f"/api/v1/teams/{node_id}")
+    etag1 = r1.headers.get("etag")
+
+    era.registered_name = "After"
+    await isolated_session.commit()
+
+    r2 = await test_client.get(f"/api/v1/teams/{node_id}", headers={"If-None-Match": etag1})
+    assert r2.status_code == 200
+    assert r2.headers.get("etag") != etag1
+    assert "After" in [e["registered_name"] for e in r2.json()["eras"]]
@@ -1,5 +1,28 @@
 import pytest
 
+from app.models.team import TeamNode, TeamEra
+from app.models.sponsor import SponsorMaster, SponsorBrand, TeamSponsorLink
+
+
+async def _seed_teams(session, nodes=20, eras_per_node=5):
+    """Enough rows that any per-row lazy load would blow the query bounds."""
+    master = SponsorMaster(legal_name="Lazy Load Co")
+    session.add(master)
+    await session.flush()
+    brand = SponsorBrand(master_id=master.master_id, brand_name="LL", default_hex_color="#abcdef")
+    team_nodes = [TeamNode(founding_year=2000) for _ in range(nodes)]
+    session.add_all([brand, *team_nodes])
+    await session.flush()
+    for node in team_nodes:
+        for year in range(2001, 2001 + eras_per_node):
+            era = TeamEra(node_id=node.node_id, season_year=year, registered_name=f"Team {year}")
+            era.sponsor_links.append(
+                TeamSponsorLink(brand_id=brand.brand_id, rank_order=1, prominence_percent=100)
+            )
+            session.add(era)
+    await session.commit()
+    session.expunge_all()
+
 
 @pytest.mark.asyncio
 async def test_team_history_no_lazy_load(test_client):
@@ -11,12 +34,17 @@ async def test_team_history_no_lazy_load(test_client):
 
 
 @pytest.mark.asyncio
-async def test_timeline_no_lazy_load(test_client):
+async def test_timeline_no_lazy_load(test_client, isolated_session, query_counter):
     # Ensure timeline endpoint returns successfully without async lazy-load errors.
+    await _seed_teams(isolated_session)
+    query_counter.clear()
     resp = await test_client.get("/api/v1/timeline?start_year=2000&end_year=2030&include_dissolved=true")
     assert resp.status_code == 200
     data = resp.json()
     assert "nodes" in data and "links" in data
+    assert len(data["nodes"]) == 20
+    # Fingerprint plus one query per eager-loaded relationship, not per row
+    assert len(query_counter) <= 6
 
 
 @pytest.mark.asyncio
@@ -34,12 +62,27 @@ async def test_team_by_id_no_lazy_load(test_client):
 
 
 @pytest.mark.asyncio
-async def test_list_teams_no_lazy_load(test_client):
+async def test_list_teams_no_lazy_load(test_client, isolated_session, query_counter):
     # Listing teams with pagination/filters should not cause lazy-load errors.
+    await _seed_teams(isolated_session)
+    query_counter.clear()
     resp = await test_client.get("/api/v1/teams?skip=0&limit=10")
     assert resp.status_code == 200
     data = resp.json()
     assert "items" in data and "total" in data
+    assert len(data["items"]) == 10
+    # Fingerprint, count, page, then eras/sponsor links/brands in bulk
+    assert len(query_counter) <= 6
+    with_total = len(query_counter)
+
+    # skip_total drops the COUNT query and reports no total
+    query_counter.clear()
+    resp = await test_client.get("/api/v1/teams?skip=0&limit=10&skip_total=true")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["total"] is None
+    assert len(data["items"]) == 10
+    assert len(query_counter) == with_total - 1
 
 
 @pytest.mark.asyncio
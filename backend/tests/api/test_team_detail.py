@@ -6,12 +6,11 @@ from app.models.enums import EventType
 
 
 @pytest.mark.asyncio
-async def test_team_history_basic(test_client, isolated_session: AsyncSession):
+async def test_team_history_basic(test_client, asgi_call, isolated_session: AsyncSession):
     # Setup: create node and eras
     node = TeamNode(founding_year=2010)
     isolated_session.add(node)
     await isolated_session.flush()
-    await isolated_session.refresh(node)
     e2010 = TeamEra(node_id=node.node_id, season_year=2010, registered_name="Team Sky", tier_level=1, uci_code="SKY")
     e2020 = TeamEra(node_id=node.node_id, season_year=2020, registered_name="Ineos Grenadiers", tier_level=1, uci_code="IGD")
     isolated_session.add(e2010)
@@ -30,13 +29,14 @@ async def test_team_history_basic(test_client, isolated_session: AsyncSession):
 
     # Conditional request with If-None-Match should return 304
     etag = resp.headers.get("ETag")
-    resp2 = await test_client.get(
+    resp2 = await asgi_call(
+        "GET",
         f"/api/v1/teams/{node.node_id}/history",
-        headers={"If-None-Match": etag},
+        {"If-None-Match": etag},
     )
-    assert resp2.status_code == 304
-    assert resp2.headers.get("ETag") == etag
-    assert resp2.headers.get("Cache-Control") == "max-age=300"
+    assert resp2.status == 304
+    assert resp2.headers.get("etag") == etag
+    assert resp2.headers.get("cache-control") == "max-age=300"
 
 
 @pytest.mark.asyncio
@@ -53,17 +53,13 @@ async def test_team_history_successor_predecessor(test_client, isolated_session:
     curr = TeamNode(founding_year=2010)
     isolated_session.add_all([prev, nextn, curr])
     await isolated_session.flush()
-    await isolated_session.refresh(prev)
-    await isolated_session.refresh(nextn)
-    await isolated_session.refresh(curr)
     # eras
     isolated_session.add(TeamEra(node_id=prev.node_id, season_year=2015, registered_name="OldTeam"))
     isolated_session.add(TeamEra(node_id=curr.node_id, season_year=2020, registered_name="CurrentTeam"))
     isolated_session.add(TeamEra(node_id=nextn.node_id, season_year=2021, registered_name="NewTeam"))
-    await isolated_session.flush()
-    # events
-    await isolated_session.merge(LineageEvent(previous_node_id=prev.node_id, next_node_id=curr.node_id, event_year=2016, event_type=EventType.LEGAL_TRANSFER))
-    await isolated_session.merge(LineageEvent(previous_node_id=curr.node_id, next_node_id=nextn.node_id, event_year=2021, event_type=EventType.MERGE))
+    # events (new rows, so plain add; merge would SELECT each by primary key first)
+    isolated_session.add(LineageEvent(previous_node_id=prev.node_id, next_node_id=curr.node_id, event_year=2016, event_type=EventType.LEGAL_TRANSFER))
+    isolated_session.add(LineageEvent(previous_node_id=curr.node_id, next_node_id=nextn.node_id, event_year=2021, event_type=EventType.MERGE))
     await isolated_session.commit()
 
     resp = await test_client.get(f"/api/v1/teams/{curr.node_id}/history")
@@ -71,5 +67,7 @@ async def test_team_history_successor_predecessor(test_client, isolated_session:
     data = resp.json()
     era = data["timeline"][0]
     assert era["predecessor"]["event_type"] == "ACQUISITION"
+    assert era["predecessor"]["name"] == "OldTeam"
     last = data["timeline"][-1]
     assert last["successor"]["event_type"] == "MERGED_INTO"
+    assert last["successor"]["name"] == "NewTeam"
@@ -1,3 +1,4 @@
+import base64
 import uuid
 import pytest
 
@@ -33,8 +34,7 @@ async def test_get_team_eras_list_and_filter(test_client, isolated_session, samp
 
     e1 = TeamEra(node_id=sample_team_node.node_id, season_year=2020, registered_name="A", tier_level=1)
     e2 = TeamEra(node_id=sample_team_node.node_id, season_year=2021, registered_name="B", tier_level=1)
-    await isolated_session.merge(e1)
-    await isolated_session.merge(e2)
+    isolated_session.add_all([e1, e2])
     await isolated_session.commit()
 
     # List all
@@ -72,3 +72,41 @@ async def test_list_teams_pagination_and_filters(test_client, sample_teams_in_db
     assert resp.status_code == 200
     data = resp.json()
     assert data["total"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_teams_list_supports_cursor_pagination(test_client, sample_teams_in_db):
+    resp = await test_client.get("/api/v1/teams", params={"limit": 3})
+    assert resp.status_code == 200
+    first = resp.json()
+    assert len(first["items"]) == 3
+    assert first["next_cursor"]
+
+    resp = await test_client.get("/api/v1/teams", params={"limit": 3, "cursor": first["next_cursor"]})
+    assert resp.status_code == 200
+    second = resp.json()
+    assert len(second["items"]) == 2
+    assert second["next_cursor"] is None
+
+    first_ids = [item["node_id"] for item in first["items"]]
+    second_ids = [item["node_id"] for item in second["items"]]
+    assert not set(first_ids) & set(second_ids)
+    years = [item["founding_year"] for item in first["items"] + second["items"]]
+    assert years == sorted(years)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        # Valid base64 JSON whose values have the wrong types
+        base64.urlsafe_b64encode(b"[1,2]").rstrip(b"=").decode(),
+        base64.urlsafe_b64encode(b"[1,[1]]").rstrip(b"=").decode(),
+        base64.urlsafe_b64encode(b'["x","00000000-0000-0000-0000-000000000000"]').rstrip(b"=").decode(),
+        base64.urlsafe_b64encode(b'{"a":1}').rstrip(b"=").decode(),
+    ],
+)
+async def test_teams_list_rejects_malformed_cursor(test_client, cursor):
+    resp = await test_client.get("/api/v1/teams", params={"cursor": cursor})
+    assert resp.status_code == 422
@@ -40,3 +40,17 @@ async def test_timeline_empty_db(test_client: AsyncClient):
     data = resp.json()
     assert data["nodes"] == [] or isinstance(data["nodes"], list)
     assert isinstance(data["links"], list)
+
+
+@pytest.mark.asyncio
+async def test_timeline_second_request_is_304_with_no_query(test_client: AsyncClient, sample_teams_in_db, query_counter):
+    resp = await test_client.get("/api/v1/timeline")
+    assert resp.status_code == 200
+    etag = resp.headers["etag"]
+
+    query_counter.clear()
+    resp2 = await test_client.get("/api/v1/timeline", headers={"If-None-Match": etag})
+    assert resp2.status_code == 304
+    assert resp2.content == b""
+    # Only the fingerprint lookup runs; the graph queries are skipped
+    assert len(query_counter) == 1
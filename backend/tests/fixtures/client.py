@@ -0,0 +1,148 @@
+"""HTTP client fixtures routing app requests through the test session."""
+from typing import AsyncGenerator, Dict, NamedTuple, Optional
+
+import orjson
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from main import app
+from app.db.database import get_db
+from app.api.health import get_checker
+
+
+class _OrjsonResponse(Response):
+    """Response whose ``json()`` decodes with orjson (same objects as ``json.loads``)."""
+
+    def json(self, **kwargs):
+        if kwargs:
+            # orjson takes no options; honour them through the stdlib decoder
+            return super().json(**kwargs)
+        return orjson.loads(self.content)
+
+
+class _OrjsonASGITransport(ASGITransport):
+    """ASGI transport handing back _OrjsonResponse, so only app responses change."""
+
+    async def handle_async_request(self, request):
+        response = await super().handle_async_request(request)
+        response.__class__ = _OrjsonResponse
+        return response
+
+
+@pytest_asyncio.fixture(scope="session")
+async def shared_http_client() -> AsyncGenerator[AsyncClient, None]:
+    """One in-process ASGI client reused by every test.
+
+    ASGITransport never runs the app lifespan, so no startup work repeats per
+    test; only the dependency overrides differ between tests. Response bodies
+    are parsed with orjson, which decodes large timeline payloads several
+    times faster; other httpx clients (e.g. MockTransport ones) are unaffected.
+    """
+    transport = _OrjsonASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture
+async def client(isolated_session, shared_http_client) -> AsyncGenerator[AsyncClient, None]:
+    """Async test HTTP client with DB dependency overridden to use isolated_session."""
+
+    async def _override_get_db():
+        yield isolated_session
+
+    # Override DB session to use test session
+    app.dependency_overrides[get_db] = _override_get_db
+
+    async def _override_checker(session: AsyncSession):
+        # Always report connected in tests
+        return True
+    
+    app.dependency_overrides[get_checker] = lambda: _override_checker
+    
+    try:
+        yield shared_http_client
+    finally:
+        shared_http_client.cookies.clear()
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_checker, None)
+
+
+@pytest_asyncio.fixture
+async def test_client(isolated_session, shared_http_client) -> AsyncGenerator[AsyncClient, None]:
+    """Async test client with DB dependency overridden to use isolated_session."""
+
+    async def _override_get_db():
+        yield isolated_session
+
+    # Override DB session and health checker to avoid external DB access
+    app.dependency_overrides[get_db] = _override_get_db
+
+    async def _override_checker(session: AsyncSession):
+        # Always report connected in tests unless a test explicitly patches otherwise
+        return True
+    app.dependency_overrides[get_checker] = lambda: _override_checker
+    try:
+        yield shared_http_client
+    finally:
+        shared_http_client.cookies.clear()
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_checker, None)
+
+
+class AsgiResponse(NamedTuple):
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+@pytest.fixture
+def asgi_call(test_client):
+    """Call the ASGI app directly for tests that only check status and headers.
+
+    Skips httpx request building and response parsing. Header names in the
+    result are lower-case. Shares test_client's dependency overrides.
+    """
+
+    async def _call(method: str, path: str, headers: Optional[Dict[str, str]] = None) -> AsgiResponse:
+        path, _, query = path.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode("latin-1"),
+            "query_string": query.encode("latin-1"),
+            "root_path": "",
+            "headers": [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in (headers or {}).items()
+            ],
+            "client": ("testclient", 50000),
+            "server": ("test", 80),
+        }
+        request_sent = False
+        messages = []
+
+        async def receive():
+            nonlocal request_sent
+            if request_sent:
+                return {"type": "http.disconnect"}
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        await app(scope, receive, send)
+        start = messages[0]
+        return AsgiResponse(
+            status=start["status"],
+            headers={k.decode("latin-1"): v.decode("latin-1") for k, v in start["headers"]},
+            body=b"".join(m.get("body", b"") for m in messages[1:]),
+        )
+
+    return _call
@@ -0,0 +1,150 @@
+"""Team and lineage data fixtures."""
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, raiseload
+
+from app.models.team import TeamNode, TeamEra
+from app.models.sponsor import TeamSponsorLink
+from app.models.lineage import LineageEvent
+from app.models.enums import EventType
+
+
+@pytest_asyncio.fixture
+async def sample_team_node(isolated_session) -> TeamNode:
+    node = TeamNode(founding_year=2000)
+    isolated_session.add(node)
+    await isolated_session.commit()
+    return node
+
+@pytest_asyncio.fixture
+async def another_team_node(isolated_session) -> TeamNode:
+    node = TeamNode(founding_year=2010)
+    isolated_session.add(node)
+    await isolated_session.commit()
+    return node
+
+@pytest_asyncio.fixture
+async def sample_team_era(isolated_session, sample_team_node) -> TeamEra:
+    era = TeamEra(node_id=sample_team_node.node_id, season_year=2001, registered_name="Test Era", tier_level=1)
+    isolated_session.add(era)
+    await isolated_session.commit()
+    return era
+
+@pytest_asyncio.fixture
+async def sample_lineage_event(isolated_session, sample_team_node, another_team_node) -> LineageEvent:
+    event = LineageEvent(previous_node_id=sample_team_node.node_id, next_node_id=another_team_node.node_id, event_year=2015, event_type=EventType.LEGAL_TRANSFER)
+    isolated_session.add(event)
+    await isolated_session.commit()
+    return event
+
+@pytest_asyncio.fixture
+async def complex_lineage_tree(isolated_session) -> dict:
+    # 3 generations: A -> B -> C, plus a split from B to D
+    node_a = TeamNode(founding_year=1990)
+    node_b = TeamNode(founding_year=2000)
+    node_c = TeamNode(founding_year=2010)
+    node_d = TeamNode(founding_year=2012)
+    isolated_session.add_all([node_a, node_b, node_c, node_d])
+    # Flush assigns node ids; no refresh needed with expire_on_commit=False
+    await isolated_session.flush()
+    event_ab = LineageEvent(previous_node_id=node_a.node_id, next_node_id=node_b.node_id, event_year=2000, event_type=EventType.LEGAL_TRANSFER)
+    event_bc = LineageEvent(previous_node_id=node_b.node_id, next_node_id=node_c.node_id, event_year=2010, event_type=EventType.LEGAL_TRANSFER)
+    event_bd = LineageEvent(previous_node_id=node_b.node_id, next_node_id=node_d.node_id, event_year=2012, event_type=EventType.SPLIT)
+    isolated_session.add_all([event_ab, event_bc, event_bd])
+    await isolated_session.commit()
+    return {
+        "A": node_a,
+        "B": node_b,
+        "C": node_c,
+        "D": node_d,
+        "events": [event_ab, event_bc, event_bd],
+    }
+
+@pytest_asyncio.fixture
+async def era_factory(isolated_session):
+    """Create a TeamNode with one TeamEra, persisted in a single flush."""
+
+    async def _make(season_year: int, registered_name: str, *, founding_year=None, **era_fields) -> TeamEra:
+        node = TeamNode(founding_year=founding_year or season_year)
+        era = TeamEra(node=node, season_year=season_year, registered_name=registered_name, **era_fields)
+        isolated_session.add_all([node, era])
+        await isolated_session.flush()
+        return era
+
+    return _make
+
+
+@pytest_asyncio.fixture
+async def load_era_sponsors(isolated_session):
+    """Reload an era with its sponsor links and their brands in one joined query.
+
+    Any other relationship on the era raises instead of lazy-loading.
+    """
+
+    async def _load(era_id) -> TeamEra:
+        stmt = (
+            select(TeamEra)
+            .where(TeamEra.era_id == era_id)
+            .options(
+                joinedload(TeamEra.sponsor_links).joinedload(TeamSponsorLink.brand),
+                raiseload("*"),
+            )
+            .execution_options(populate_existing=True)
+        )
+        return (await isolated_session.execute(stmt)).unique().scalar_one()
+
+    return _load
+
+
+@pytest_asyncio.fixture
+async def sample_teams_in_db(isolated_session):
+    """Create 5 teams with eras across different years and tiers."""
+    nodes = [
+        TeamNode(founding_year=base_year)
+        for base_year in [1995, 2000, 2005, 2010, 2015]
+    ]
+    isolated_session.add_all(nodes)
+    await isolated_session.flush()
+
+    # Add eras with various years and tiers
+    tier_cycle = [1, 2, 3, 2, 1]
+    years = [2020, 2021, 2022, 2023, 2024]
+    eras = []
+    for i, node in enumerate(nodes):
+        # Each node gets two eras in consecutive years
+        eras.append(TeamEra(
+            node_id=node.node_id,
+            season_year=years[i],
+            registered_name=f"Team {i} A",
+            tier_level=tier_cycle[i],
+        ))
+        eras.append(TeamEra(
+            node_id=node.node_id,
+            season_year=years[i] + 1,
+            registered_name=f"Team {i} B",
+            tier_level=tier_cycle[-(i+1)],
+        ))
+    isolated_session.add_all(eras)
+    await isolated_session.commit()
+    return nodes
+
+
+@pytest_asyncio.fixture
+async def sample_teams(isolated_session):
+    """Create sample teams with eras for testing merges."""
+    nodes = [TeamNode(founding_year=2000 + i * 5) for i in range(3)]
+    isolated_session.add_all(nodes)
+    await isolated_session.flush()
+
+    # Add era for 2020
+    isolated_session.add_all([
+        TeamEra(
+            node_id=node.node_id,
+            season_year=2020,
+            registered_name=f"Sample Team {i+1}",
+            tier_level=(i % 3) + 1
+        )
+        for i, node in enumerate(nodes)
+    ])
+    await isolated_session.commit()
+    return nodes
@@ -0,0 +1,159 @@
+"""Database fixtures: one shared in-memory engine, per-test rolled-back sessions."""
+import asyncio
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base
+from app.services.timeline_service import timeline_cache
+import app.db.database as database_module
+
+
+# Durability is irrelevant for a throwaway in-memory database
+_TEST_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA locking_mode=EXCLUSIVE",
+    "PRAGMA cache_size=-64000",
+)
+
+
+def _compile_schema() -> tuple:
+    # Compiled when the engine is built rather than at import, once every
+    # model module (users, edits, ...) has registered its table
+    dialect = sqlite.dialect()
+    statements = []
+    for table in Base.metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(dialect=dialect)))
+        statements.extend(
+            str(CreateIndex(index).compile(dialect=dialect)) for index in table.indexes
+        )
+    return tuple(statements)
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the whole run so the session-scoped engine can be shared."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_engine():
+    """Create one in-memory SQLite engine and schema for the whole test session."""
+    test_db_url = "sqlite+aiosqlite:///:memory:"
+    # StaticPool hands out the same connection, so every test sees one database
+    engine = create_async_engine(test_db_url, echo=False, future=True, poolclass=StaticPool)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs nest inside a real
+        # outer transaction (pysqlite otherwise defers BEGIN until the first DML)
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        for pragma in _TEST_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _on_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # Create all tables once from plain DDL, skipping create_all's reflection
+    async with engine.begin() as conn:
+        for statement in _compile_schema():
+            await conn.exec_driver_sql(statement)
+    
+    # Override the module-level engine so the app uses our test engine
+    original_engine = database_module.engine
+    original_session_maker = database_module.async_session_maker
+    
+    database_module.engine = engine
+    database_module.async_session_maker = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    
+    yield engine
+    
+    # Restore original engine
+    database_module.engine = original_engine
+    database_module.async_session_maker = original_session_maker
+    
+    await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def _clear_timeline_cache():
+    """Drop cached timeline graphs so results never leak between tests."""
+    yield
+    timeline_cache.clear()
+
+
+@pytest_asyncio.fixture
+async def isolated_engine(test_engine):
+    """Provide the shared test engine for tests."""
+    yield test_engine
+
+
+@pytest_asyncio.fixture
+async def isolated_session(isolated_engine) -> AsyncGenerator[AsyncSession, None]:
+    """Yield a session whose work is rolled back when the test ends.
+
+    The session joins an outer transaction on a dedicated connection; its own
+    commits and rollbacks only release or roll back SAVEPOINTs, so discarding
+    the outer transaction at teardown leaves the shared schema empty again
+    without any DDL.
+    """
+    async with isolated_engine.connect() as conn:
+        outer = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            if outer.is_active:
+                await outer.rollback()
+
+
+@pytest.fixture
+def query_counter(isolated_engine):
+    """Record every SQL statement sent to the test engine while the test runs.
+
+    The test session's own SAVEPOINT bookkeeping is left out, so the list holds
+    only the queries the code under test issued. Clear it after seeding data.
+    """
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith(("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")):
+            statements.append(statement)
+
+    event.listen(isolated_engine.sync_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(isolated_engine.sync_engine, "before_cursor_execute", _record)
+
+
+@pytest_asyncio.fixture
+async def db_session(isolated_session) -> AsyncGenerator[AsyncSession, None]:
+    """Alias for isolated_session for convenience."""
+    yield isolated_session
+
+
+# Aliases for consistency with test files
+@pytest_asyncio.fixture
+async def async_session(isolated_session) -> AsyncSession:
+    """Alias for isolated_session."""
+    return isolated_session
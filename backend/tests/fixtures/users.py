@@ -0,0 +1,116 @@
+"""User and token fixtures for each role."""
+from functools import lru_cache
+
+import pytest
+import pytest_asyncio
+
+from app.models.user import User, UserRole
+from app.core.security import create_access_token
+
+
+@lru_cache(maxsize=128)
+def _token_for(user_id: str) -> str:
+    # A fresh token per user id is enough for tests, so sign each one only once
+    return create_access_token({"sub": user_id})
+
+
+# Auth fixtures
+@pytest_asyncio.fixture
+async def new_user(isolated_session) -> User:
+    """Create a new user with NEW_USER role."""
+    user = User(
+        google_id="test_new_user_123",
+        email="newuser@test.com",
+        display_name="New User",
+        role=UserRole.NEW_USER
+    )
+    isolated_session.add(user)
+    await isolated_session.commit()
+    return user
+
+
+@pytest_asyncio.fixture
+async def trusted_user(isolated_session) -> User:
+    """Create a trusted user with TRUSTED_USER role."""
+    user = User(
+        google_id="test_trusted_user_123",
+        email="trusteduser@test.com",
+        display_name="Trusted User",
+        role=UserRole.TRUSTED_USER,
+        approved_edits_count=5
+    )
+    isolated_session.add(user)
+    await isolated_session.commit()
+    return user
+
+
+@pytest_asyncio.fixture
+async def admin_user(isolated_session) -> User:
+    """Create an admin user with ADMIN role."""
+    user = User(
+        google_id="test_admin_user_123",
+        email="admin@test.com",
+        display_name="Admin User",
+        role=UserRole.ADMIN
+    )
+    isolated_session.add(user)
+    await isolated_session.commit()
+    return user
+
+
+@pytest_asyncio.fixture
+async def banned_user(isolated_session) -> User:
+    """Create a banned user."""
+    user = User(
+        google_id="test_banned_user_123",
+        email="banneduser@test.com",
+        display_name="Banned User",
+        role=UserRole.NEW_USER,
+        is_banned=True,
+        banned_reason="Test ban"
+    )
+    isolated_session.add(user)
+    await isolated_session.commit()
+    return user
+
+
+@pytest.fixture
+def new_user_token(new_user: User) -> str:
+    """Generate JWT token for new user."""
+    return _token_for(str(new_user.user_id))
+
+
+@pytest.fixture
+def trusted_user_token(trusted_user: User) -> str:
+    """Generate JWT token for trusted user."""
+    return _token_for(str(trusted_user.user_id))
+
+
+@pytest.fixture
+def admin_user_token(admin_user: User) -> str:
+    """Generate JWT token for admin user."""
+    return _token_for(str(admin_user.user_id))
+
+
+@pytest.fixture
+def banned_user_token(banned_user: User) -> str:
+    """Generate JWT token for banned user."""
+    return _token_for(str(banned_user.user_id))
+
+
+@pytest_asyncio.fixture
+async def test_user_new(new_user) -> User:
+    """Alias for new_user."""
+    return new_user
+
+
+@pytest_asyncio.fixture
+async def test_user_trusted(trusted_user) -> User:
+    """Alias for trusted_user."""
+    return trusted_user
+
+
+@pytest_asyncio.fixture
+async def test_user_admin(admin_user) -> User:
+    """Alias for admin_user."""
+    return admin_user
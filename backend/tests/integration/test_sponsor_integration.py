@@ -3,14 +3,19 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.team import TeamNode, TeamEra
+from app.models.sponsor import SponsorMaster, SponsorBrand, TeamSponsorLink
 from app.services.sponsor_service import SponsorService
 
+pytestmark = pytest.mark.xdist_group(__name__)
+
 
 @pytest.mark.asyncio
 class TestSponsorIntegration:
     """Integration tests for complete sponsor scenarios."""
     
-    async def test_soudal_quick_step_scenario(self, db_session: AsyncSession):
+    async def test_soudal_quick_step_scenario(
+        self, db_session: AsyncSession, era_factory, load_era_sponsors, query_counter
+    ):
         """Test the full Soudal-Quick-Step team scenario.
         
         This recreates a realistic scenario:
@@ -21,19 +26,9 @@ class TestSponsorIntegration:
         - Verify jersey composition
         """
         # Create team node and era
-        node = TeamNode(founding_year=2003)
-        db_session.add(node)
-        await db_session.flush()
-        
-        era = TeamEra(
-            node_id=node.node_id,
-            season_year=2023,
-            registered_name="Soudal Quick-Step",
-            uci_code="SOQ",
-            tier_level=1
+        era = await era_factory(
+            2023, "Soudal Quick-Step", founding_year=2003, uci_code="SOQ", tier_level=1
         )
-        db_session.add(era)
-        await db_session.flush()
         
         # Create master sponsor
         soudal_group = await SponsorService.create_master(
@@ -41,7 +36,6 @@ class TestSponsorIntegration:
             legal_name="Soudal Group",
             industry_sector="Construction Materials"
         )
-        await db_session.commit()
         
         # Create two brands under the same master
         soudal_brand = await SponsorService.create_brand(
@@ -57,7 +51,6 @@ class TestSponsorIntegration:
             brand_name="Quick-Step",
             default_hex_color="#FFFFFF"  # White
         )
-        await db_session.commit()
         
         # Link Soudal as primary sponsor (60%)
         soudal_link = await SponsorService.link_sponsor_to_era(
@@ -76,7 +69,6 @@ class TestSponsorIntegration:
             rank_order=2,
             prominence_percent=40
         )
-        await db_session.commit()
         
         # Verify the links were created
         assert soudal_link.rank_order == 1
@@ -94,11 +86,13 @@ class TestSponsorIntegration:
         assert validation['sponsor_count'] == 2
         assert validation['remaining_percent'] == 0
         
-        # Get jersey composition for visualization
+        # Get jersey composition for visualization; brands must not lazy-load
+        query_counter.clear()
         composition = await SponsorService.get_era_jersey_composition(
             db_session,
             era.era_id
         )
+        assert len(query_counter) == 1
         
         assert len(composition) == 2
         
@@ -114,8 +108,10 @@ class TestSponsorIntegration:
         assert composition[1]['prominence_percent'] == 40
         assert composition[1]['rank_order'] == 2
         
-        # Verify TeamEra properties
-        await db_session.refresh(era, ["sponsor_links"])
+        # Verify TeamEra properties; links and brands arrive in the same statement
+        query_counter.clear()
+        era = await load_era_sponsors(era.era_id)
+        assert len(query_counter) == 1
         assert len(era.sponsor_links) == 2
         assert era.validate_sponsor_total() is True
         
@@ -123,77 +119,30 @@ class TestSponsorIntegration:
         assert ordered_sponsors[0].brand.brand_name == "Soudal"
         assert ordered_sponsors[1].brand.brand_name == "Quick-Step"
     
-    async def test_multi_master_sponsor_scenario(self, db_session: AsyncSession):
+    async def test_multi_master_sponsor_scenario(self, db_session: AsyncSession, era_factory):
         """Test a scenario with sponsors from different master companies."""
         # Create team
-        node = TeamNode(founding_year=2010)
-        db_session.add(node)
-        await db_session.flush()
-        
-        era = TeamEra(
-            node_id=node.node_id,
-            season_year=2024,
-            registered_name="Multi-Sponsor Team",
-            uci_code="MST",
-            tier_level=1
-        )
-        db_session.add(era)
-        await db_session.flush()
-        
-        # Create three different master sponsors
-        bike_company = await SponsorService.create_master(
-            db_session,
-            "BikeManufacturer Inc",
-            "Bicycle Manufacturing"
-        )
-        
-        beverage_company = await SponsorService.create_master(
-            db_session,
-            "Energy Drinks Ltd",
-            "Beverages"
-        )
-        
-        apparel_company = await SponsorService.create_master(
-            db_session,
-            "Sportswear Corp",
-            "Sports Apparel"
-        )
-        await db_session.commit()
-        
-        # Create one brand for each
-        bike_brand = await SponsorService.create_brand(
-            db_session,
-            bike_company.master_id,
-            "SuperBike",
-            "#FF0000"  # Red
-        )
-        
-        energy_brand = await SponsorService.create_brand(
+        era = await era_factory(
+            2024, "Multi-Sponsor Team", founding_year=2010, uci_code="MST", tier_level=1
+        )
+        
+        # Three master sponsors, one brand each, all linked in one batch
+        bike_company = SponsorMaster(legal_name="BikeManufacturer Inc", industry_sector="Bicycle Manufacturing")
+        beverage_company = SponsorMaster(legal_name="Energy Drinks Ltd", industry_sector="Beverages")
+        apparel_company = SponsorMaster(legal_name="Sportswear Corp", industry_sector="Sports Apparel")
+        bike_brand = SponsorBrand(master=bike_company, brand_name="SuperBike", default_hex_color="#FF0000")  # Red
+        energy_brand = SponsorBrand(master=beverage_company, brand_name="PowerDrink", default_hex_color="#FFFF00")  # Yellow
+        apparel_brand = SponsorBrand(master=apparel_company, brand_name="ProKit", default_hex_color="#0000FF")  # Blue
+        await SponsorService.bulk_create(
             db_session,
-            beverage_company.master_id,
-            "PowerDrink",
-            "#FFFF00"  # Yellow
-        )
-        
-        apparel_brand = await SponsorService.create_brand(
-            db_session,
-            apparel_company.master_id,
-            "ProKit",
-            "#0000FF"  # Blue
-        )
-        await db_session.commit()
-        
-        # Link all three with different prominences
-        await SponsorService.link_sponsor_to_era(
-            db_session, era.era_id, bike_brand.brand_id, 1, 50
-        )
-        await SponsorService.link_sponsor_to_era(
-            db_session, era.era_id, energy_brand.brand_id, 2, 30
-        )
-        await SponsorService.link_sponsor_to_era(
-            db_session, era.era_id, apparel_brand.brand_id, 3, 20
+            masters=[bike_company, beverage_company, apparel_company],
+            brands=[bike_brand, energy_brand, apparel_brand],
+            links=[
+                TeamSponsorLink(era_id=era.era_id, brand=bike_brand, rank_order=1, prominence_percent=50),
+                TeamSponsorLink(era_id=era.era_id, brand=energy_brand, rank_order=2, prominence_percent=30),
+                TeamSponsorLink(era_id=era.era_id, brand=apparel_brand, rank_order=3, prominence_percent=20),
+            ],
         )
-        await db_session.commit()
         
         # Verify composition
         composition = await SponsorService.get_era_jersey_composition(
@@ -215,21 +164,10 @@ class TestSponsorIntegration:
         assert validation['total_percent'] == 100
         assert validation['sponsor_count'] == 3
     
-    async def test_partial_sponsorship_scenario(self, db_session: AsyncSession):
+    async def test_partial_sponsorship_scenario(self, db_session: AsyncSession, era_factory):
         """Test a scenario where sponsors don't fill 100% of the jersey."""
         # Create team
-        node = TeamNode(founding_year=2015)
-        db_session.add(node)
-        await db_session.flush()
-        
-        era = TeamEra(
-            node_id=node.node_id,
-            season_year=2024,
-            registered_name="Partial Team",
-            tier_level=2
-        )
-        db_session.add(era)
-        await db_session.flush()
+        era = await era_factory(2024, "Partial Team", founding_year=2015, tier_level=2)
         
         # Create sponsor
         master = await SponsorService.create_master(db_session, "Small Sponsor Co")
@@ -239,13 +177,11 @@ class TestSponsorIntegration:
             "SmallBrand",
             "#00FF00"
         )
-        await db_session.commit()
         
         # Link with only 75% prominence (leaving 25% unsponsored)
         await SponsorService.link_sponsor_to_era(
             db_session, era.era_id, brand.brand_id, 1, 75
         )
-        await db_session.commit()
         
         # Verify validation
         validation = await SponsorService.validate_era_sponsors(db_session, era.era_id)
@@ -259,7 +195,7 @@ class TestSponsorIntegration:
         assert len(composition) == 1
         assert composition[0]['prominence_percent'] == 75
     
-    async def test_sponsor_evolution_across_eras(self, db_session: AsyncSession):
+    async def test_sponsor_evolution_across_eras(self, db_session: AsyncSession, query_counter):
         """Test how sponsors change across different team eras."""
         # Create team node
         node = TeamNode(founding_year=2010)
@@ -299,7 +235,6 @@ class TestSponsorIntegration:
         brand_c = await SponsorService.create_brand(
             db_session, sponsor_c_master.master_id, "Brand C", "#0000AA"
         )
-        await db_session.commit()
         
         # 2020: Brand A (100%)
         await SponsorService.link_sponsor_to_era(
@@ -321,27 +256,31 @@ class TestSponsorIntegration:
         await SponsorService.link_sponsor_to_era(
             db_session, era_2022.era_id, brand_c.brand_id, 2, 40
         )
-        await db_session.commit()
+        
+        # Fetch all three compositions in one round trip
+        query_counter.clear()
+        comps = await SponsorService.get_compositions_bulk(
+            db_session, [era_2020.era_id, era_2021.era_id, era_2022.era_id]
+        )
+        assert len(query_counter) == 1
         
         # Verify 2020 composition
-        comp_2020 = await SponsorService.get_era_jersey_composition(db_session, era_2020.era_id)
+        comp_2020 = comps[era_2020.era_id]
         assert len(comp_2020) == 1
         assert comp_2020[0]['brand_name'] == "Brand A"
         
         # Verify 2021 composition
-        comp_2021 = await SponsorService.get_era_jersey_composition(db_session, era_2021.era_id)
+        comp_2021 = comps[era_2021.era_id]
         assert len(comp_2021) == 2
         assert comp_2021[0]['brand_name'] == "Brand A"
         assert comp_2021[1]['brand_name'] == "Brand B"
         
         # Verify 2022 composition (Brand A gone, Brand C added)
-        comp_2022 = await SponsorService.get_era_jersey_composition(db_session, era_2022.era_id)
+        comp_2022 = comps[era_2022.era_id]
         assert len(comp_2022) == 2
         assert comp_2022[0]['brand_name'] == "Brand B"
         assert comp_2022[1]['brand_name'] == "Brand C"
         
-        # Verify all eras are still valid
-        for era in [era_2020, era_2021, era_2022]:
-            validation = await SponsorService.validate_era_sponsors(db_session, era.era_id)
-            assert validation['valid'] is True
-            assert validation['total_percent'] == 100
+        # Verify all eras are fully sponsored
+        for composition in comps.values():
+            assert sum(c['prominence_percent'] for c in composition) == 100
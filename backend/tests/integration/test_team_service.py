@@ -7,6 +7,8 @@ from app.models.team import TeamNode
 from app.services.team_service import TeamService
 from app.core.exceptions import NodeNotFoundException
 
+pytestmark = pytest.mark.xdist_group(__name__)
+
 
 @pytest.mark.asyncio
 async def test_full_team_service_workflow(isolated_session):
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, patch
 from app.scraper.base import BaseScraper
 from app.scraper.rate_limiter import RateLimiter
 import httpx
@@ -15,14 +15,33 @@ class MockScraper(BaseScraper):
         return {"team_name": team_identifier}
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def rate_limiter():
     return RateLimiter(min_delay_seconds=0)
 
 
-@pytest.fixture
+# Per-test responses keyed by URL path, served by the module's MockTransport
+routes = {}
+
+
+def _route(request: httpx.Request) -> httpx.Response:
+    return routes[request.url.path](request)
+
+
+@pytest.fixture(scope="module")
 def mock_scraper(rate_limiter):
-    return MockScraper(rate_limiter)
+    """One scraper for the module, its client answering from ``routes``."""
+    scraper = MockScraper(rate_limiter)
+    scraper.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_route), headers=scraper.client.headers
+    )
+    return scraper
+
+
+@pytest.fixture(autouse=True)
+def _reset_state(rate_limiter):
+    rate_limiter.last_request_time.clear()
+    routes.clear()
 
 
 @pytest.mark.asyncio
@@ -38,54 +57,48 @@ async def test_fetch_with_rate_limiting(mock_scraper):
     """Test that fetch method calls rate limiter"""
     url = "http://mock.example.com/page"
     mock_html = "<html><body>Test</body></html>"
+    requested = []
 
-    with patch.object(mock_scraper.rate_limiter, "wait_if_needed", new_callable=AsyncMock) as mock_wait:
-        with patch.object(mock_scraper.client, "get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.text = mock_html
-            mock_response.raise_for_status = MagicMock()
-            mock_get.return_value = mock_response
+    def page(request):
+        requested.append(str(request.url))
+        return httpx.Response(200, text=mock_html)
+
+    routes["/page"] = page
 
-            result = await mock_scraper.fetch(url)
+    with patch.object(mock_scraper.rate_limiter, "wait_if_needed", new_callable=AsyncMock) as mock_wait:
+        result = await mock_scraper.fetch(url)
 
-            # Verify rate limiter was called
-            mock_wait.assert_called_once_with(mock_scraper.domain)
-            # Verify HTTP request was made
-            mock_get.assert_called_once_with(url)
-            # Verify result
-            assert result == mock_html
+        # Verify rate limiter was called
+        mock_wait.assert_called_once_with(mock_scraper.domain)
+    # Verify HTTP request was made
+    assert requested == [url]
+    # Verify result
+    assert result == mock_html
 
 
 @pytest.mark.asyncio
 async def test_fetch_handles_http_errors(mock_scraper):
     """Test that fetch handles HTTP errors gracefully"""
-    url = "http://mock.example.com/notfound"
+    routes["/notfound"] = lambda request: httpx.Response(404)
 
-    with patch.object(mock_scraper.rate_limiter, "wait_if_needed", new_callable=AsyncMock):
-        with patch.object(mock_scraper.client, "get") as mock_get:
-            mock_get.side_effect = httpx.HTTPStatusError(
-                "404 Not Found", request=MagicMock(), response=MagicMock()
-            )
+    result = await mock_scraper.fetch("http://mock.example.com/notfound")
 
-            result = await mock_scraper.fetch(url)
-
-            # Should return None on error
-            assert result is None
+    # Should return None on error
+    assert result is None
 
 
 @pytest.mark.asyncio
 async def test_fetch_handles_network_errors(mock_scraper):
     """Test that fetch handles network errors gracefully"""
-    url = "http://mock.example.com/page"
+    def unreachable(request):
+        raise httpx.NetworkError("Connection failed", request=request)
 
-    with patch.object(mock_scraper.rate_limiter, "wait_if_needed", new_callable=AsyncMock):
-        with patch.object(mock_scraper.client, "get") as mock_get:
-            mock_get.side_effect = httpx.NetworkError("Connection failed")
+    routes["/page"] = unreachable
 
-            result = await mock_scraper.fetch(url)
+    result = await mock_scraper.fetch("http://mock.example.com/page")
 
-            # Should return None on network error
-            assert result is None
+    # Should return None on network error
+    assert result is None
 
 
 @pytest.mark.asyncio
@@ -98,10 +111,12 @@ async def test_user_agent_header_is_set(rate_limiter):
 
 
 @pytest.mark.asyncio
-async def test_scraper_close_cleans_up(mock_scraper):
+async def test_scraper_close_cleans_up(rate_limiter):
     """Test that close method cleans up resources"""
-    with patch.object(mock_scraper.client, "aclose", new_callable=AsyncMock) as mock_close:
-        await mock_scraper.close()
+    # Own instance: closing the shared client would break later tests
+    scraper = MockScraper(rate_limiter)
+    with patch.object(scraper.client, "aclose", new_callable=AsyncMock) as mock_close:
+        await scraper.close()
         mock_close.assert_called_once()
 
 
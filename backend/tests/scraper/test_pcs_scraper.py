@@ -1,7 +1,9 @@
 """Tests for ProCyclingStats scraper."""
 import pytest
+from functools import lru_cache
 from pathlib import Path
 
+from bs4 import BeautifulSoup
 from app.scraper.parsers.pcs_scraper import PCScraper
 from app.scraper.rate_limiter import RateLimiter
 
@@ -10,13 +12,19 @@ from app.scraper.rate_limiter import RateLimiter
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "pcs"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def pcs_scraper():
-    """Create PCScraper instance for testing."""
+    """Create one PCScraper instance shared by the module's tests."""
     rate_limiter = RateLimiter()
     return PCScraper(rate_limiter=rate_limiter)
 
 
+@pytest.fixture(autouse=True)
+def _reset_rate_limiter(pcs_scraper):
+    pcs_scraper.rate_limiter.last_request_time.clear()
+
+
+@lru_cache(maxsize=None)
 def load_fixture(filename: str) -> str:
     """Load HTML fixture file."""
     filepath = FIXTURES_DIR / filename
@@ -24,93 +32,78 @@ def load_fixture(filename: str) -> str:
         return f.read()
 
 
+@pytest.fixture(scope="module")
+def parsed_fixtures():
+    """Parse each HTML fixture once; the extractors only read the soup.
+
+    Uses the same 'html.parser' backend as PCScraper so results match production.
+    """
+    return {
+        name: BeautifulSoup(load_fixture(name), 'html.parser')
+        for name in (
+            "team_worldtour.html",
+            "team_proteam.html",
+            "team_continental.html",
+            "team_with_uci_code.html",
+        )
+    }
+
+
+@pytest.mark.cpu
 class TestPCScraper:
     """Tests for PCScraper parsing methods."""
     
-    def test_parse_worldteam(self, pcs_scraper):
-        """Test parsing WorldTeam page."""
-        html = load_fixture("team_worldtour.html")
-        data = pcs_scraper.parse_team_page(html)
+    @pytest.mark.parametrize(
+        "filename, team_name, uci_code, tier",
+        [
+            ("team_worldtour.html", "Team Visma | Lease a Bike", "TVL", "WT"),
+            ("team_proteam.html", "TotalEnergies", "TEN", "PT"),
+            ("team_continental.html", "Intermarché - Circus - Wanty", None, "CT"),
+        ],
+    )
+    def test_parse_team_page(self, pcs_scraper, filename, team_name, uci_code, tier):
+        """Test parsing WorldTeam, ProTeam and Continental team pages."""
+        data = pcs_scraper.parse_team_page(load_fixture(filename))
         
         assert data is not None
         assert data.source == "procyclingstats"
-        assert data.team_name == "Team Visma | Lease a Bike"
-        assert data.uci_code == "TVL"
-        assert data.tier == "WT"
+        assert data.team_name == team_name
+        assert data.uci_code == uci_code
+        assert data.tier == tier
         assert len(data.sponsors) > 0
     
-    def test_parse_proteam(self, pcs_scraper):
-        """Test parsing ProTeam page."""
-        html = load_fixture("team_proteam.html")
-        data = pcs_scraper.parse_team_page(html)
-        
-        assert data is not None
-        assert data.team_name == "TotalEnergies"
-        assert data.uci_code == "TEN"
-        assert data.tier == "PT"
-    
-    def test_parse_continental(self, pcs_scraper):
-        """Test parsing Continental team page."""
-        html = load_fixture("team_continental.html")
-        data = pcs_scraper.parse_team_page(html)
-        
-        assert data is not None
-        assert data.team_name == "Intermarché - Circus - Wanty"
-        assert data.tier == "CT"
-    
-    def test_extract_team_name(self, pcs_scraper):
+    def test_extract_team_name(self, pcs_scraper, parsed_fixtures):
         """Test team name extraction."""
-        html = load_fixture("team_with_uci_code.html")
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = parsed_fixtures["team_with_uci_code.html"]
         
         name = pcs_scraper._extract_team_name(soup)
         assert name == "UAE Team Emirates"
     
-    def test_extract_uci_code(self, pcs_scraper):
+    def test_extract_uci_code(self, pcs_scraper, parsed_fixtures):
         """Test UCI code extraction."""
-        html = load_fixture("team_with_uci_code.html")
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = parsed_fixtures["team_with_uci_code.html"]
         
         code = pcs_scraper._extract_uci_code(soup)
         assert code == "UAD"
     
-    def test_extract_uci_code_missing(self, pcs_scraper):
+    def test_extract_uci_code_missing(self, pcs_scraper, parsed_fixtures):
         """Test UCI code extraction when missing."""
-        html = load_fixture("team_continental.html")
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = parsed_fixtures["team_continental.html"]
         
         code = pcs_scraper._extract_uci_code(soup)
         assert code is None
     
-    def test_extract_tier_worldteam(self, pcs_scraper):
-        """Test tier extraction for WorldTeam."""
-        html = load_fixture("team_worldtour.html")
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        tier = pcs_scraper._extract_tier(soup)
-        assert tier == "WT"
-    
-    def test_extract_tier_proteam(self, pcs_scraper):
-        """Test tier extraction for ProTeam."""
-        html = load_fixture("team_proteam.html")
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        tier = pcs_scraper._extract_tier(soup)
-        assert tier == "PT"
-    
-    def test_extract_tier_continental(self, pcs_scraper):
-        """Test tier extraction for Continental team."""
-        html = load_fixture("team_continental.html")
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        tier = pcs_scraper._extract_tier(soup)
-        assert tier == "CT"
+    @pytest.mark.parametrize(
+        "filename, expected",
+        [
+            ("team_worldtour.html", "WT"),
+            ("team_proteam.html", "PT"),
+            ("team_continental.html", "CT"),
+        ],
+    )
+    def test_extract_tier(self, pcs_scraper, parsed_fixtures, filename, expected):
+        """Test tier extraction for each team level."""
+        assert pcs_scraper._extract_tier(parsed_fixtures[filename]) == expected
     
     def test_extract_sponsors(self, pcs_scraper):
         """Test sponsor extraction from team name."""
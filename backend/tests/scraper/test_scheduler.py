@@ -1,6 +1,6 @@
 import pytest
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+import itertools
 from app.scraper.scheduler import ScraperScheduler
 from app.scraper.base import BaseScraper
 from app.scraper.rate_limiter import RateLimiter
@@ -13,7 +13,7 @@ class MockScraperA(BaseScraper):
         return "scraper-a.com"
 
     async def scrape_team(self, team_identifier: str):
-        await asyncio.sleep(0.01)  # Simulate work
+        await asyncio.sleep(0)  # Yield like real I/O would
         return {"source": "A", "team": team_identifier}
 
 
@@ -23,7 +23,7 @@ class MockScraperB(BaseScraper):
         return "scraper-b.com"
 
     async def scrape_team(self, team_identifier: str):
-        await asyncio.sleep(0.01)  # Simulate work
+        await asyncio.sleep(0)  # Yield like real I/O would
         return {"source": "B", "team": team_identifier}
 
 
@@ -36,14 +36,31 @@ class FailingScraper(BaseScraper):
         raise Exception("Scraper failed")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def rate_limiter():
     return RateLimiter(min_delay_seconds=0)
 
 
+# Scraper instances are shared by the module; tests override their methods
+# with monkeypatch so the originals come back after each test
+@pytest.fixture(scope="module")
+def scraper_a(rate_limiter):
+    return MockScraperA(rate_limiter)
+
+
+@pytest.fixture(scope="module")
+def scraper_b(rate_limiter):
+    return MockScraperB(rate_limiter)
+
+
+@pytest.fixture(scope="module")
+def failing_scraper(rate_limiter):
+    return FailingScraper(rate_limiter)
+
+
 @pytest.fixture
-def scrapers(rate_limiter):
-    return [MockScraperA(rate_limiter), MockScraperB(rate_limiter)]
+def scrapers(scraper_a, scraper_b):
+    return [scraper_a, scraper_b]
 
 
 @pytest.fixture
@@ -65,7 +82,7 @@ async def test_run_once_executes_all_scrapers(scheduler):
 
 
 @pytest.mark.asyncio
-async def test_scrapers_run_in_order(scheduler):
+async def test_scrapers_run_in_order(scheduler, monkeypatch):
     """Test that scrapers execute in the order they were added"""
     team_id = "test-team"
     execution_order = []
@@ -79,8 +96,8 @@ async def test_scrapers_run_in_order(scheduler):
         execution_order.append("B")
         return {"source": "B"}
 
-    scheduler.scrapers[0].scrape_team = track_scraper_a
-    scheduler.scrapers[1].scrape_team = track_scraper_b
+    monkeypatch.setattr(scheduler.scrapers[0], "scrape_team", track_scraper_a)
+    monkeypatch.setattr(scheduler.scrapers[1], "scrape_team", track_scraper_b)
 
     await scheduler.run_once(team_id)
 
@@ -88,29 +105,31 @@ async def test_scrapers_run_in_order(scheduler):
 
 
 @pytest.mark.asyncio
-async def test_stop_interrupts_continuous_mode(rate_limiter):
+async def test_stop_interrupts_continuous_mode(rate_limiter, scraper_a, monkeypatch):
     """Test that stop() interrupts continuous scraping"""
-    scrapers = [MockScraperA(rate_limiter)]
-    scheduler = ScraperScheduler(scrapers, rate_limiter)
+    scheduler = ScraperScheduler([scraper_a], rate_limiter)
 
-    run_count = 0
+    runs = itertools.count(1)
+    done = asyncio.Event()
 
     async def count_runs(*args, **kwargs):
-        nonlocal run_count
-        run_count += 1
-        return {"run": run_count}
+        run = next(runs)
+        if run >= 3:
+            done.set()
+        return {"run": run}
 
-    scheduler.scrapers[0].scrape_team = count_runs
+    monkeypatch.setattr(scheduler.scrapers[0], "scrape_team", count_runs)
 
     # Start continuous mode in background
-    task = asyncio.create_task(scheduler.run_continuous(["team1", "team2"], interval_seconds=0.1))
+    task = asyncio.create_task(scheduler.run_continuous(["team1", "team2"], interval_seconds=0))
 
-    # Let it run for a bit
-    await asyncio.sleep(0.3)
+    # Let it run a few times
+    await asyncio.wait_for(done.wait(), timeout=2.0)
 
     # Stop it
     scheduler.stop()
     await asyncio.wait_for(task, timeout=1.0)
+    run_count = next(runs) - 1
 
     # Should have run a few times but not indefinitely
     assert run_count > 0
@@ -118,10 +137,9 @@ async def test_stop_interrupts_continuous_mode(rate_limiter):
 
 
 @pytest.mark.asyncio
-async def test_error_in_one_scraper_doesnt_stop_others(rate_limiter):
+async def test_error_in_one_scraper_doesnt_stop_others(rate_limiter, failing_scraper, scraper_a):
     """Test that error in one scraper doesn't prevent others from running"""
-    scrapers = [FailingScraper(rate_limiter), MockScraperA(rate_limiter)]
-    scheduler = ScraperScheduler(scrapers, rate_limiter)
+    scheduler = ScraperScheduler([failing_scraper, scraper_a], rate_limiter)
 
     results = await scheduler.run_once("test-team")
 
@@ -133,15 +151,17 @@ async def test_error_in_one_scraper_doesnt_stop_others(rate_limiter):
 
 
 @pytest.mark.asyncio
-async def test_close_cleans_up_all_scrapers(scheduler):
+async def test_close_cleans_up_all_scrapers(scheduler, monkeypatch):
     """Test that close() calls close on all scrapers"""
     close_calls = []
 
-    async def track_close(scraper_name):
-        close_calls.append(scraper_name)
+    def track_close(scraper_name):
+        async def close():
+            close_calls.append(scraper_name)
+        return close
 
-    scheduler.scrapers[0].close = lambda: track_close("A")
-    scheduler.scrapers[1].close = lambda: track_close("B")
+    monkeypatch.setattr(scheduler.scrapers[0], "close", track_close("A"))
+    monkeypatch.setattr(scheduler.scrapers[1], "close", track_close("B"))
 
     await scheduler.close()
 
@@ -160,26 +180,28 @@ async def test_run_once_with_empty_scrapers_list(rate_limiter):
 
 
 @pytest.mark.asyncio
-async def test_continuous_mode_processes_all_teams(rate_limiter):
+async def test_continuous_mode_processes_all_teams(rate_limiter, scraper_a, monkeypatch):
     """Test that continuous mode processes all team identifiers"""
-    scraper = MockScraperA(rate_limiter)
-    scheduler = ScraperScheduler([scraper], rate_limiter)
+    scheduler = ScraperScheduler([scraper_a], rate_limiter)
 
     processed_teams = []
+    done = asyncio.Event()
 
     async def track_teams(team_id):
         processed_teams.append(team_id)
+        if {"team1", "team2", "team3"} <= set(processed_teams):
+            done.set()
         return {"team": team_id}
 
-    scheduler.scrapers[0].scrape_team = track_teams
+    monkeypatch.setattr(scheduler.scrapers[0], "scrape_team", track_teams)
 
     # Run one cycle
     task = asyncio.create_task(
-        scheduler.run_continuous(["team1", "team2", "team3"], interval_seconds=0.05)
+        scheduler.run_continuous(["team1", "team2", "team3"], interval_seconds=0)
     )
 
     # Wait for one full cycle
-    await asyncio.sleep(0.3)
+    await asyncio.wait_for(done.wait(), timeout=2.0)
     scheduler.stop()
     await asyncio.wait_for(task, timeout=1.0)
 
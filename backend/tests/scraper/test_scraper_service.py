@@ -1,17 +1,27 @@
 """Tests for ScraperService."""
 import pytest
+from unittest.mock import AsyncMock, MagicMock
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.scraper_service import ScraperService
 from app.scraper.models import ScrapedTeamData
-from app.models.team import TeamNode, TeamEra
+from app.models.team import TeamEra
+
+
+@pytest.fixture
+def scraper_service(db_session: AsyncSession) -> ScraperService:
+    return ScraperService(db=db_session)
+
+
+@pytest.fixture
+def fake_session() -> MagicMock:
+    """Stand-in session for paths that must not (or need not) touch the database."""
+    return MagicMock(spec=AsyncSession, flush=AsyncMock(), commit=AsyncMock(), refresh=AsyncMock())
 
 
 @pytest.mark.asyncio
-async def test_upsert_new_team(db_session: AsyncSession):
+async def test_upsert_new_team(scraper_service: ScraperService):
     """Test upserting a new team creates node and era."""
-    service = ScraperService(db=db_session)
-    
     data = ScrapedTeamData(
         source="procyclingstats",
         team_name="Test Team",
@@ -20,7 +30,7 @@ async def test_upsert_new_team(db_session: AsyncSession):
         sponsors=["Test Sponsor"]
     )
     
-    era = await service.upsert_scraped_data(data)
+    era = await scraper_service.upsert_scraped_data(data)
     
     assert era.era_id is not None
     assert era.registered_name == "Test Team"
@@ -31,46 +41,62 @@ async def test_upsert_new_team(db_session: AsyncSession):
 
 
 @pytest.mark.asyncio
-async def test_upsert_with_proteam_tier(db_session: AsyncSession):
-    """Test tier conversion for ProTeam."""
-    service = ScraperService(db=db_session)
-    
+@pytest.mark.parametrize("tier, tier_level", [("WT", 1), ("PT", 2), ("CT", 3)])
+async def test_upsert_tier_mapping(scraper_service: ScraperService, tier, tier_level):
+    """Test tier string to tier_level conversion."""
     data = ScrapedTeamData(
         source="procyclingstats",
-        team_name="ProTeam Test",
-        uci_code="PTT",
-        tier="PT",
+        team_name=f"{tier} Test",
+        uci_code=f"{tier}T",
+        tier=tier,
         sponsors=[]
     )
     
-    era = await service.upsert_scraped_data(data)
+    era = await scraper_service.upsert_scraped_data(data)
     
-    assert era.tier_level == 2  # PT = 2
+    assert era.tier_level == tier_level
 
 
 @pytest.mark.asyncio
-async def test_upsert_with_continental_tier(db_session: AsyncSession):
-    """Test tier conversion for Continental team."""
-    service = ScraperService(db=db_session)
-    
-    data = ScrapedTeamData(
-        source="procyclingstats",
-        team_name="Continental Test",
-        uci_code="CTT",
-        tier="CT",
-        sponsors=[]
-    )
-    
-    era = await service.upsert_scraped_data(data)
+async def test_upsert_batch_tier_mapping(scraper_service: ScraperService, query_counter):
+    """Test batch upsert maps every tier and inserts with one statement per table."""
+    tiers = {"WT": 1, "PT": 2, "CT": 3, None: None}
+    items = [
+        ScrapedTeamData(
+            source="procyclingstats",
+            team_name=f"Batch {tier}",
+            uci_code=None,
+            tier=tier,
+            sponsors=[]
+        )
+        for tier in tiers
+    ]
+    
+    eras = await scraper_service.upsert_scraped_data_batch(items)
+    
+    assert [era.registered_name for era in eras] == [item.team_name for item in items]
+    assert [era.tier_level for era in eras] == list(tiers.values())
+    assert all(era.node_id is not None for era in eras)
+    assert sum(stmt.startswith("INSERT") for stmt in query_counter) == 2
+
+
+@pytest.mark.asyncio
+async def test_upsert_batch_rejects_missing_team_name(fake_session: MagicMock):
+    """Test that one invalid item stops the whole batch before any write."""
+    items = [
+        ScrapedTeamData(source="procyclingstats", team_name="Valid Team", uci_code=None, tier="CT", sponsors=[]),
+        ScrapedTeamData(source="procyclingstats", team_name="", uci_code=None, tier="CT", sponsors=[]),
+    ]
     
-    assert era.tier_level == 3  # CT = 3
+    with pytest.raises(ValueError, match="team_name is required"):
+        await ScraperService(db=fake_session).upsert_scraped_data_batch(items)
+    fake_session.add_all.assert_not_called()
+    fake_session.commit.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_upsert_without_team_name(db_session: AsyncSession):
+async def test_upsert_without_team_name(fake_session: MagicMock):
     """Test that missing team_name raises error."""
-    service = ScraperService(db=db_session)
-    
     data = ScrapedTeamData(
         source="procyclingstats",
         team_name="",
@@ -80,14 +106,13 @@ async def test_upsert_without_team_name(db_session: AsyncSession):
     )
     
     with pytest.raises(ValueError, match="team_name is required"):
-        await service.upsert_scraped_data(data)
+        await ScraperService(db=fake_session).upsert_scraped_data(data)
+    fake_session.add.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_upsert_without_uci_code(db_session: AsyncSession):
+async def test_upsert_without_uci_code(scraper_service: ScraperService):
     """Test upserting team without UCI code."""
-    service = ScraperService(db=db_session)
-    
     data = ScrapedTeamData(
         source="procyclingstats",
         team_name="No Code Team",
@@ -96,17 +121,15 @@ async def test_upsert_without_uci_code(db_session: AsyncSession):
         sponsors=[]
     )
     
-    era = await service.upsert_scraped_data(data)
+    era = await scraper_service.upsert_scraped_data(data)
     
     assert era.registered_name == "No Code Team"
     assert era.uci_code is None
 
 
 @pytest.mark.asyncio
-async def test_upsert_without_tier(db_session: AsyncSession):
+async def test_upsert_without_tier(scraper_service: ScraperService):
     """Test upserting team without tier information."""
-    service = ScraperService(db=db_session)
-    
     data = ScrapedTeamData(
         source="procyclingstats",
         team_name="No Tier Team",
@@ -115,29 +138,16 @@ async def test_upsert_without_tier(db_session: AsyncSession):
         sponsors=[]
     )
     
-    era = await service.upsert_scraped_data(data)
+    era = await scraper_service.upsert_scraped_data(data)
     
     assert era.tier_level is None
 
 
 @pytest.mark.asyncio
-async def test_handle_sponsors_placeholder(db_session: AsyncSession):
+async def test_handle_sponsors_placeholder(fake_session: MagicMock):
     """Test that handle_sponsors is a placeholder."""
-    service = ScraperService(db=db_session)
-    
-    # Create a node and era
-    node = TeamNode(founding_year=2024)
-    db_session.add(node)
-    await db_session.flush()
-    
-    era = TeamEra(
-        node_id=node.node_id,
-        season_year=2024,
-        registered_name="Test Team",
-        uci_code="TST"
-    )
-    db_session.add(era)
-    await db_session.commit()
+    service = ScraperService(db=fake_session)
+    era = TeamEra(season_year=2024, registered_name="Test Team", uci_code="TST")
     
     sponsors = await service.handle_sponsors(era, ["Sponsor1", "Sponsor2"])
     
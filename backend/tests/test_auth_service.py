@@ -1,18 +1,32 @@
+import asyncio
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
-from datetime import datetime, timezone
+from unittest.mock import Mock, AsyncMock
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
+from sqlalchemy import insert, select
 
 from app.services.auth_service import AuthService
-from app.models.user import User, UserRole
+from app.models.user import RefreshToken, User, UserRole
 from app.core.security import create_access_token, create_refresh_token, verify_token, hash_token
 
 
 class TestAuthService:
     """Test suite for AuthService"""
     
+    @pytest.fixture
+    def google_decode(self, monkeypatch):
+        """Replace Google ID token decoding; tests set its return value."""
+        decode = Mock()
+        monkeypatch.setattr('app.services.auth_service.google_jwt.decode', decode)
+        return decode
+    
+    @pytest.fixture
+    def google_certs(self, monkeypatch):
+        """Serve an empty cert set instead of fetching Google's."""
+        monkeypatch.setattr(AuthService, '_get_google_certs', AsyncMock(return_value={}))
+    
     @pytest.mark.asyncio
-    async def test_verify_google_token_success(self):
+    async def test_verify_google_token_success(self, google_decode, google_certs):
         """Test successful Google token verification"""
         mock_token = "valid_google_token"
         expected_user_info = {
@@ -22,47 +36,133 @@ class TestAuthService:
             'avatar_url': 'https://example.com/avatar.jpg'
         }
         
-        with patch('app.services.auth_service.id_token.verify_oauth2_token') as mock_verify:
-            mock_verify.return_value = {
-                'iss': 'accounts.google.com',
-                'sub': '123456789',
-                'email': 'test@example.com',
-                'name': 'Test User',
-                'picture': 'https://example.com/avatar.jpg'
-            }
-            
-            result = await AuthService.verify_google_token(mock_token)
-            
-            assert result == expected_user_info
-            mock_verify.assert_called_once()
+        google_decode.return_value = {
+            'iss': 'accounts.google.com',
+            'sub': '123456789',
+            'email': 'test@example.com',
+            'name': 'Test User',
+            'picture': 'https://example.com/avatar.jpg'
+        }
+        
+        result = await AuthService.verify_google_token(mock_token)
+        
+        assert result == expected_user_info
+        google_decode.assert_called_once()
     
     @pytest.mark.asyncio
-    async def test_verify_google_token_invalid(self):
+    async def test_verify_google_token_invalid(self, google_decode):
         """Test Google token verification with invalid token"""
         mock_token = "invalid_token"
         
-        with patch('app.services.auth_service.id_token.verify_oauth2_token') as mock_verify:
-            mock_verify.side_effect = ValueError('Invalid token')
-            
-            result = await AuthService.verify_google_token(mock_token)
-            
-            assert result is None
+        result = await AuthService.verify_google_token(mock_token)
+        
+        assert result is None
+        google_decode.assert_not_called()
     
     @pytest.mark.asyncio
-    async def test_verify_google_token_wrong_issuer(self):
+    async def test_verify_google_token_wrong_issuer(self, google_decode, google_certs):
         """Test Google token verification with wrong issuer"""
         mock_token = "token_with_wrong_issuer"
         
-        with patch('app.services.auth_service.id_token.verify_oauth2_token') as mock_verify:
-            mock_verify.return_value = {
-                'iss': 'malicious.com',
-                'sub': '123456789',
-                'email': 'test@example.com'
-            }
-            
-            result = await AuthService.verify_google_token(mock_token)
-            
-            assert result is None
+        google_decode.return_value = {
+            'iss': 'malicious.com',
+            'sub': '123456789',
+            'email': 'test@example.com'
+        }
+        
+        result = await AuthService.verify_google_token(mock_token)
+        
+        assert result is None
+    
+    @pytest.mark.asyncio
+    async def test_google_certs_are_cached_until_key_rotation(self, monkeypatch):
+        """Certs are fetched once and refetched only for an unknown key id"""
+        import httpx
+        from jose import jwt
+        from app.services import auth_service
+
+        fetches = []
+
+        def handler(request):
+            fetches.append(request.url)
+            return httpx.Response(200, json={f"key{len(fetches)}": "cert"})
+
+        monkeypatch.setattr(auth_service, "_google_http", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        monkeypatch.setattr(auth_service, "_google_certs", auth_service.TTLCache(maxsize=1, ttl=3600))
+        recent = auth_service.TTLCache(maxsize=1, ttl=60)
+        monkeypatch.setattr(auth_service, "_google_certs_recent", recent)
+
+        def token_with_kid(kid):
+            return jwt.encode({"sub": "1"}, "secret", algorithm="HS256", headers={"kid": kid})
+
+        assert "key1" in await AuthService._get_google_certs(token_with_kid("key1"))
+        assert "key1" in await AuthService._get_google_certs(token_with_kid("key1"))
+        assert len(fetches) == 1
+        # Right after a fetch, unknown (junk) key ids are served the cached certs
+        assert "key1" in await AuthService._get_google_certs(token_with_kid("junk"))
+        assert len(fetches) == 1
+        # Once the refetch window has passed, a rotated key id triggers one fetch
+        recent.clear()
+        assert "key2" in await AuthService._get_google_certs(token_with_kid("key2"))
+        assert len(fetches) == 2
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_cert_lookups_share_one_fetch(self, monkeypatch):
+        """Concurrent logins on a cold cache make a single request to Google"""
+        import httpx
+        from jose import jwt
+        from app.services import auth_service
+
+        fetches = []
+
+        async def handler(request):
+            fetches.append(request.url)
+            await asyncio.sleep(0)
+            return httpx.Response(200, json={"key1": "cert"})
+
+        monkeypatch.setattr(auth_service, "_google_http", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        monkeypatch.setattr(auth_service, "_google_certs", auth_service.TTLCache(maxsize=1, ttl=3600))
+        monkeypatch.setattr(auth_service, "_google_certs_recent", auth_service.TTLCache(maxsize=1, ttl=60))
+
+        token = jwt.encode({"sub": "1"}, "secret", algorithm="HS256", headers={"kid": "key1"})
+        results = await asyncio.gather(*(AuthService._get_google_certs(token) for _ in range(5)))
+
+        assert all("key1" in certs for certs in results)
+        assert len(fetches) == 1
+    
+    @pytest.mark.asyncio
+    async def test_verify_google_token_cert_fetch_failure(self, monkeypatch):
+        """A Google outage while fetching certs fails the login instead of raising"""
+        import httpx
+        from jose import jwt
+        from app.services import auth_service
+
+        def handler(request):
+            return httpx.Response(503)
+
+        monkeypatch.setattr(auth_service, "_google_http", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        monkeypatch.setattr(auth_service, "_google_certs", auth_service.TTLCache(maxsize=1, ttl=3600))
+        monkeypatch.setattr(auth_service, "_google_certs_recent", auth_service.TTLCache(maxsize=1, ttl=60))
+
+        token = jwt.encode({"sub": "1"}, "secret", algorithm="HS256", headers={"kid": "key1"})
+        assert await AuthService.verify_google_token(token) is None
+    
+    @pytest.mark.asyncio
+    async def test_google_http_client_is_reopened_after_shutdown(self, monkeypatch):
+        """A later app lifespan gets a fresh client instead of the closed one"""
+        import httpx
+        from app.services import auth_service
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+        monkeypatch.setattr(auth_service, "_google_http", client)
+
+        await auth_service.close_google_http()
+        assert client.is_closed
+
+        reopened = auth_service._get_google_http()
+        assert reopened is not client
+        assert not reopened.is_closed
+        await auth_service.close_google_http()
     
     @pytest.mark.asyncio
     async def test_get_or_create_user_new_user(self, db_session):
@@ -85,23 +185,35 @@ class TestAuthService:
         assert user.is_banned is False
     
     @pytest.mark.asyncio
-    async def test_get_or_create_user_existing_user(self, db_session, test_user):
+    async def test_get_or_create_user_existing_user(self, db_session):
         """Test retrieving an existing user"""
+        # Seed through Core so the user is in the table but not in the session's identity map
+        user_id = uuid4()
+        await db_session.execute(
+            insert(User),
+            [{
+                'user_id': user_id,
+                'google_id': 'existing_user_123',
+                'email': 'existing@example.com',
+                'display_name': 'Existing User',
+                'role': UserRole.TRUSTED_USER,
+                'approved_edits_count': 5,
+            }],
+        )
         google_user_info = {
-            'google_id': test_user.google_id,
-            'email': test_user.email,
+            'google_id': 'existing_user_123',
+            'email': 'existing@example.com',
             'display_name': 'Updated Name',
             'avatar_url': 'https://example.com/updated_avatar.jpg'
         }
         
-        original_last_login = test_user.last_login_at
-        
         user = await AuthService.get_or_create_user(db_session, google_user_info)
         
-        assert user.user_id == test_user.user_id
-        assert user.google_id == test_user.google_id
+        assert user.user_id == user_id
+        assert user.google_id == 'existing_user_123'
+        assert user.role == UserRole.TRUSTED_USER
         # Last login should be updated
-        assert user.last_login_at != original_last_login
+        assert user.last_login_at is not None
     
     @pytest.mark.asyncio
     async def test_create_tokens(self, db_session, test_user):
@@ -124,8 +236,18 @@ class TestAuthService:
         assert refresh_payload is not None
         assert refresh_payload['type'] == 'refresh'
         assert refresh_payload['sub'] == str(test_user.user_id)
+        
+        # The refresh token is stored only as its hash; check the row id, not a hydrated object
+        token_id = await db_session.scalar(
+            select(RefreshToken.token_id).where(
+                RefreshToken.user_id == test_user.user_id,
+                RefreshToken.token_hash == hash_token(tokens.refresh_token),
+            )
+        )
+        assert token_id is not None
 
 
+@pytest.mark.cpu
 class TestSecurityFunctions:
     """Test suite for security utility functions"""
     
@@ -164,6 +286,17 @@ class TestSecurityFunctions:
         assert 'exp' in payload
         assert 'jti' in payload  # Should have unique identifier
     
+    def test_access_token_matches_jose_encoding(self):
+        """Precomputed HS256 signing yields the same token python-jose would"""
+        from jose import jwt
+        from app.core.config import settings
+
+        expires = timedelta(minutes=5)
+        token = create_access_token({"sub": "abc"}, expires_delta=expires)
+        claims = jwt.get_unverified_claims(token)
+        expected = jwt.encode(claims, settings.JWT_SECRET_KEY, algorithm="HS256")
+        assert token == expected
+
     def test_verify_invalid_token(self):
         """Test verifying an invalid token"""
         invalid_token = "not.a.valid.token"
@@ -183,6 +316,16 @@ class TestSecurityFunctions:
         from app.core.security import verify_token_hash
         assert verify_token_hash(token, hashed) is True
         assert verify_token_hash("wrong_token", hashed) is False
+    
+    def test_token_hash_is_keyed_by_secret(self, monkeypatch):
+        """The stored hash depends on the JWT secret, not just the token"""
+        from app.core.config import settings
+        token = "some_refresh_token_value"
+        hashed = hash_token(token)
+        
+        monkeypatch.setattr(settings, "JWT_SECRET_KEY", "x" * 100)
+        assert hash_token(token) != hashed
+        assert len(hash_token(token)) == len(hashed) == 64
 
 
 # Fixtures for tests
@@ -198,7 +341,6 @@ async def test_user(db_session):
     )
     db_session.add(user)
     await db_session.flush()
-    await db_session.refresh(user)
     return user
 
 
@@ -213,7 +355,6 @@ async def admin_user(db_session):
     )
     db_session.add(user)
     await db_session.flush()
-    await db_session.refresh(user)
     return user
 
 
@@ -230,5 +371,4 @@ async def banned_user(db_session):
     )
     db_session.add(user)
     await db_session.flush()
-    await db_session.refresh(user)
     return user
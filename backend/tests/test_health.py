@@ -116,3 +116,28 @@ async def test_create_tables_runs_without_errors(isolated_engine):
     from app.db.database import Base
     async with isolated_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+@pytest.mark.asyncio
+async def test_create_tables_is_idempotent(monkeypatch):
+    """create_tables only creates what is missing and can run repeatedly."""
+    import sqlalchemy as sa
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from app.db import database as database_module
+    from app.db.database import create_tables
+
+    # A private throwaway database: dropping tables on the shared test engine
+    # would break every later test if recreation ever failed
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=sa.pool.StaticPool)
+    monkeypatch.setattr(database_module, "engine", engine)
+    try:
+        await create_tables()
+        async with engine.begin() as conn:
+            await conn.execute(sa.text("DROP TABLE edits"))
+        await create_tables()
+        await create_tables()
+        async with engine.connect() as conn:
+            names = await conn.run_sync(lambda c: sa.inspect(c).get_table_names())
+        assert "edits" in names
+    finally:
+        await engine.dispose()
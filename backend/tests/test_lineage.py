@@ -28,7 +28,6 @@ async def test_create_merge_event(isolated_session: AsyncSession, sample_team_no
     next_node = TeamNode(founding_year=2020)
     isolated_session.add(next_node)
     await isolated_session.commit()
-    await isolated_session.refresh(next_node)
     event1 = await service.create_event(
         previous_id=sample_team_node.node_id,
         next_id=next_node.node_id,
@@ -52,7 +51,6 @@ async def test_create_spiritual_succession(isolated_session: AsyncSession, sampl
     successor = TeamNode(founding_year=sample_team_node.founding_year + 10)
     isolated_session.add(successor)
     await isolated_session.commit()
-    await isolated_session.refresh(successor)
     event = await service.create_event(
         previous_id=sample_team_node.node_id,
         next_id=successor.node_id,
@@ -69,8 +67,6 @@ async def test_create_split_events(isolated_session: AsyncSession, sample_team_n
     child2 = TeamNode(founding_year=sample_team_node.founding_year + 5)
     isolated_session.add_all([child1, child2])
     await isolated_session.commit()
-    await isolated_session.refresh(child1)
-    await isolated_session.refresh(child2)
     e1 = await service.create_event(
         previous_id=sample_team_node.node_id,
         next_id=child1.node_id,
@@ -122,7 +118,6 @@ async def test_relationship_traversal(isolated_session: AsyncSession, sample_tea
     next_node = TeamNode(founding_year=2020)
     isolated_session.add(next_node)
     await isolated_session.commit()
-    await isolated_session.refresh(next_node)
     await service.create_event(
         previous_id=sample_team_node.node_id,
         next_id=next_node.node_id,
@@ -159,7 +154,6 @@ async def test_get_lineage_chain(isolated_session: AsyncSession, sample_team_nod
     successor = TeamNode(founding_year=sample_team_node.founding_year + 3)
     isolated_session.add(successor)
     await isolated_session.commit()
-    await isolated_session.refresh(successor)
     await service.create_event(
         previous_id=sample_team_node.node_id,
         next_id=successor.node_id,
@@ -177,7 +171,6 @@ async def test_cascade_delete_sets_null(isolated_session: AsyncSession, sample_t
     successor = TeamNode(founding_year=sample_team_node.founding_year + 2)
     isolated_session.add(successor)
     await isolated_session.commit()
-    await isolated_session.refresh(successor)
     event = await service.create_event(
         previous_id=sample_team_node.node_id,
         next_id=successor.node_id,
@@ -202,7 +195,6 @@ async def test_incomplete_merge_warning(isolated_session: AsyncSession, sample_t
     successor = TeamNode(founding_year=sample_team_node.founding_year + 5)
     isolated_session.add(successor)
     await isolated_session.commit()
-    await isolated_session.refresh(successor)
     merge_event = await service.create_event(
         previous_id=sample_team_node.node_id,
         next_id=successor.node_id,
@@ -220,7 +212,6 @@ async def test_merge_completion_removes_warning(isolated_session: AsyncSession,
     successor = TeamNode(founding_year=2025)
     isolated_session.add(successor)
     await isolated_session.commit()
-    await isolated_session.refresh(successor)
     first = await service.create_event(
         previous_id=sample_team_node.node_id,
         next_id=successor.node_id,
@@ -246,7 +237,6 @@ async def test_incomplete_split_warning(isolated_session: AsyncSession, sample_t
     child = TeamNode(founding_year=sample_team_node.founding_year + 2)
     isolated_session.add(child)
     await isolated_session.commit()
-    await isolated_session.refresh(child)
     split_event = await service.create_event(
         previous_id=sample_team_node.node_id,
         next_id=child.node_id,
@@ -265,8 +255,6 @@ async def test_split_completion_removes_warning(isolated_session: AsyncSession,
     child2 = TeamNode(founding_year=sample_team_node.founding_year + 3)
     isolated_session.add_all([child1, child2])
     await isolated_session.commit()
-    await isolated_session.refresh(child1)
-    await isolated_session.refresh(child2)
     first = await service.create_event(
         previous_id=sample_team_node.node_id,
         next_id=child1.node_id,
@@ -12,6 +12,7 @@ def test_root_endpoint():
     assert data["status"] == "ok"
     assert "message" in data
     assert "version" in data
+    assert response.headers["cache-control"] == "public, max-age=3600"
 
 
 def test_health_endpoint():
@@ -29,3 +30,63 @@ def test_app_startup():
     """Test that the FastAPI app starts successfully"""
     assert app.title == "ChainLines API"
     assert app.version == "0.1.0"
+
+
+def test_cors_preflight_is_cacheable():
+    """Preflight responses advertise how long browsers may cache them"""
+    response = client.options(
+        "/api/v1/timeline",
+        headers={
+            "Origin": "http://localhost:5173",
+            "Access-Control-Request-Method": "GET",
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["access-control-max-age"] == "86400"
+
+
+def test_cors_preflight_allows_configured_headers_only():
+    """Preflights for headers outside the allow list are rejected"""
+    allowed = client.options(
+        "/api/v1/timeline",
+        headers={
+            "Origin": "http://localhost:5173",
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "Authorization, If-None-Match",
+        },
+    )
+    assert allowed.status_code == 200
+
+    rejected = client.options(
+        "/api/v1/timeline",
+        headers={
+            "Origin": "http://localhost:5173",
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "X-Custom-Header",
+        },
+    )
+    assert rejected.status_code == 400
+
+
+def test_lifespan_raises_threadpool_limit():
+    """Startup widens the AnyIO thread pool used for sync code"""
+    import anyio
+    from app.core.config import settings
+
+    async def _total_tokens():
+        return anyio.to_thread.current_default_thread_limiter().total_tokens
+
+    with TestClient(app) as lifespan_client:
+        assert lifespan_client.portal.call(_total_tokens) == settings.THREADPOOL_TOKENS
+
+
+def test_validation_error_omits_body_outside_debug(monkeypatch):
+    """422 responses only echo the request body in debug mode"""
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "DEBUG", False)
+    response = client.get("/api/v1/timeline", params={"start_year": "not-a-year"})
+    assert response.status_code == 422
+    data = response.json()
+    assert data["detail"]
+    assert "body" not in data
@@ -67,6 +67,22 @@ async def test_team_node_indexes_exist(isolated_engine):
         assert "idx_team_node_dissolution" in indexes
 
 
+@pytest.mark.asyncio
+async def test_hot_path_indexes_declared_on_models(isolated_engine):
+    """Indexes backing timeline year filters are declared on the models too."""
+    async with isolated_engine.connect() as conn:
+        def _get_index_names(sync_conn):
+            insp = sa.inspect(sync_conn)
+            return (
+                {idx["name"] for idx in insp.get_indexes("team_era")},
+                {idx["name"] for idx in insp.get_indexes("lineage_event")},
+            )
+
+        era_indexes, event_indexes = await conn.run_sync(_get_index_names)
+        assert {"idx_team_era_node", "idx_team_era_year"} <= era_indexes
+        assert "idx_lineage_event_year" in event_indexes
+
+
 @pytest.mark.asyncio
 async def test_create_team_node(isolated_session):
     """Creating and flushing a TeamNode should populate fields."""
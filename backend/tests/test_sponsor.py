@@ -532,6 +532,38 @@ class TestSponsorService:
         
         assert link2.prominence_percent == 40
     
+    async def test_bulk_create_prominence_total_validation(self, db_session: AsyncSession):
+        """Test that bulk_create counts existing links toward the 100% limit."""
+        node = TeamNode(founding_year=2010)
+        db_session.add(node)
+        await db_session.flush()
+        
+        era = TeamEra(node_id=node.node_id, season_year=2020, registered_name="Test")
+        db_session.add(era)
+        await db_session.flush()
+        
+        master = SponsorMaster(legal_name="Bulk Test")
+        brand1 = SponsorBrand(master=master, brand_name="Brand 1", default_hex_color="#111111")
+        brand2 = SponsorBrand(master=master, brand_name="Brand 2", default_hex_color="#222222")
+        await SponsorService.bulk_create(
+            db_session,
+            masters=[master],
+            brands=[brand1, brand2],
+            links=[TeamSponsorLink(era_id=era.era_id, brand=brand1, rank_order=1, prominence_percent=60)],
+        )
+        await db_session.commit()
+        
+        # 60% already linked, so another 50% would total 110%
+        with pytest.raises(ValidationException, match="exceed 100%"):
+            await SponsorService.bulk_create(
+                db_session,
+                links=[TeamSponsorLink(era_id=era.era_id, brand_id=brand2.brand_id, rank_order=2, prominence_percent=50)],
+            )
+        
+        validation = await SponsorService.validate_era_sponsors(db_session, era.era_id)
+        assert validation['total_percent'] == 60
+        assert validation['sponsor_count'] == 1
+    
     async def test_validate_era_sponsors(self, db_session: AsyncSession):
         """Test validate_era_sponsors method."""
         # Setup
@@ -579,7 +611,7 @@ class TestSponsorService:
         assert validation['sponsor_count'] == 2
         assert validation['remaining_percent'] == 0
     
-    async def test_get_era_jersey_composition(self, db_session: AsyncSession):
+    async def test_get_era_jersey_composition(self, db_session: AsyncSession, query_counter):
         """Test retrieving ordered jersey composition."""
         # Setup
         node = TeamNode(founding_year=2010)
@@ -603,7 +635,9 @@ class TestSponsorService:
         await db_session.commit()
         
         # Get composition
+        query_counter.clear()
         composition = await SponsorService.get_era_jersey_composition(db_session, era.era_id)
+        assert len(query_counter) == 1
         
         assert len(composition) == 3
         # Should be ordered by rank
@@ -620,12 +654,50 @@ class TestSponsorService:
         assert composition[2]['prominence_percent'] == 20
         assert composition[2]['rank_order'] == 3
 
+    
+    async def test_get_compositions_bulk(self, db_session: AsyncSession):
+        """Test bulk compositions include unsponsored eras and reject unknown ids."""
+        node = TeamNode(founding_year=2010)
+        db_session.add(node)
+        await db_session.flush()
+        
+        sponsored = TeamEra(node_id=node.node_id, season_year=2020, registered_name="Sponsored")
+        bare = TeamEra(node_id=node.node_id, season_year=2021, registered_name="Bare")
+        db_session.add_all([sponsored, bare])
+        await db_session.flush()
+        
+        master = await SponsorService.create_master(db_session, "Bulk Comp Co")
+        b1 = await SponsorService.create_brand(db_session, master.master_id, "Second", "#222222")
+        b2 = await SponsorService.create_brand(db_session, master.master_id, "First", "#111111")
+        await SponsorService.link_sponsor_to_era(db_session, sponsored.era_id, b1.brand_id, 2, 30)
+        await SponsorService.link_sponsor_to_era(db_session, sponsored.era_id, b2.brand_id, 1, 70)
+        await db_session.commit()
+        
+        comps = await SponsorService.get_compositions_bulk(
+            db_session, [sponsored.era_id, bare.era_id]
+        )
+        assert comps[sponsored.era_id] == await SponsorService.get_era_jersey_composition(
+            db_session, sponsored.era_id
+        )
+        assert [c['brand_name'] for c in comps[sponsored.era_id]] == ["First", "Second"]
+        assert comps[bare.era_id] == []
+        
+        with pytest.raises(NodeNotFoundException):
+            await SponsorService.get_compositions_bulk(db_session, [bare.era_id, uuid.uuid4()])
+        
+        # String ids are accepted and the result is keyed by UUID
+        comps = await SponsorService.get_compositions_bulk(db_session, [str(bare.era_id)])
+        assert comps == {bare.era_id: []}
+        composition = await SponsorService.get_era_jersey_composition(
+            db_session, str(sponsored.era_id)
+        )
+        assert [c['brand_name'] for c in composition] == ["First", "Second"]
 
 @pytest.mark.asyncio
 class TestTeamEraSponsors:
     """Tests for TeamEra sponsor-related properties."""
     
-    async def test_sponsors_ordered_property(self, db_session: AsyncSession):
+    async def test_sponsors_ordered_property(self, db_session: AsyncSession, load_era_sponsors):
         """Test that sponsors_ordered returns links in rank order."""
         # Setup
         node = TeamNode(founding_year=2010)
@@ -648,8 +720,8 @@ class TestTeamEraSponsors:
         await SponsorService.link_sponsor_to_era(db_session, era.era_id, b2.brand_id, 2, 30)
         await db_session.commit()
         
-        # Refresh era with eager loading of sponsor relationships
-        await db_session.refresh(era, ["sponsor_links"])
+        # Reload era with sponsor links and brands eagerly loaded
+        era = await load_era_sponsors(era.era_id)
         
         ordered = era.sponsors_ordered
         assert len(ordered) == 3
@@ -657,7 +729,7 @@ class TestTeamEraSponsors:
         assert ordered[1].rank_order == 2
         assert ordered[2].rank_order == 3
     
-    async def test_validate_sponsor_total_method(self, db_session: AsyncSession):
+    async def test_validate_sponsor_total_method(self, db_session: AsyncSession, load_era_sponsors):
         """Test validate_sponsor_total method on TeamEra."""
         # Setup
         node = TeamNode(founding_year=2010)
@@ -674,17 +746,17 @@ class TestTeamEraSponsors:
         await db_session.commit()
         
         # Empty era should be valid
-        await db_session.refresh(era, ["sponsor_links"])
+        era = await load_era_sponsors(era.era_id)
         assert era.validate_sponsor_total() is True
         
         # Add 60%
         await SponsorService.link_sponsor_to_era(db_session, era.era_id, b1.brand_id, 1, 60)
         await db_session.commit()
-        await db_session.refresh(era, ["sponsor_links"])
+        era = await load_era_sponsors(era.era_id)
         assert era.validate_sponsor_total() is True
         
         # Add 40% (total 100%)
         await SponsorService.link_sponsor_to_era(db_session, era.era_id, b2.brand_id, 2, 40)
         await db_session.commit()
-        await db_session.refresh(era, ["sponsor_links"])
+        era = await load_era_sponsors(era.era_id)
         assert era.validate_sponsor_total() is True
@@ -0,0 +1,54 @@
+"""Unit tests for TeamDetailService helpers."""
+import pytest
+
+from app.models.enums import EventType
+from app.models.lineage import LineageEvent
+from app.models.team import TeamEra, TeamNode
+from app.services.team_detail_service import TeamDetailService
+
+
+@pytest.mark.parametrize(
+    "season_year,dissolution_year,expected",
+    [
+        (2010, None, "historical"),
+        (2024, None, "active"),
+        (2025, None, "active"),
+        (2024, 2030, "active"),
+        (2010, 2015, "historical"),
+        (2015, 2015, "dissolved"),
+        (2016, 2015, "dissolved"),
+    ],
+)
+def test_calculate_era_status(season_year, dissolution_year, expected):
+    era = TeamEra(season_year=season_year, registered_name="Status Team")
+    assert TeamDetailService.calculate_era_status(era, 2024, dissolution_year) == expected
+
+
+@pytest.mark.asyncio
+async def test_history_matches_nearest_transitions(isolated_session):
+    team = TeamNode(founding_year=2000)
+    before = TeamNode(founding_year=2000)
+    mid = TeamNode(founding_year=2000)
+    after_a = TeamNode(founding_year=2000)
+    after_b = TeamNode(founding_year=2000)
+    isolated_session.add_all([team, before, mid, after_a, after_b])
+    await isolated_session.flush()
+    isolated_session.add_all([
+        TeamEra(node_id=team.node_id, season_year=2010, registered_name="Team 2010"),
+        TeamEra(node_id=team.node_id, season_year=2015, registered_name="Team 2015"),
+        TeamEra(node_id=team.node_id, season_year=2020, registered_name="Team 2020"),
+        TeamEra(node_id=before.node_id, season_year=2008, registered_name="Before"),
+        TeamEra(node_id=mid.node_id, season_year=2012, registered_name="Mid"),
+        TeamEra(node_id=after_a.node_id, season_year=2014, registered_name="After A"),
+        TeamEra(node_id=after_b.node_id, season_year=2021, registered_name="After B"),
+        LineageEvent(previous_node_id=mid.node_id, next_node_id=team.node_id, event_year=2016, event_type=EventType.MERGE),
+        LineageEvent(previous_node_id=before.node_id, next_node_id=team.node_id, event_year=2009, event_type=EventType.LEGAL_TRANSFER),
+        LineageEvent(previous_node_id=team.node_id, next_node_id=after_b.node_id, event_year=2021, event_type=EventType.LEGAL_TRANSFER),
+        LineageEvent(previous_node_id=team.node_id, next_node_id=after_a.node_id, event_year=2014, event_type=EventType.SPLIT),
+    ])
+    await isolated_session.commit()
+
+    history = await TeamDetailService.get_team_history(isolated_session, team.node_id)
+
+    assert [e.predecessor.name for e in history.timeline] == ["Before", "Before", "Mid"]
+    assert [e.successor.name for e in history.timeline] == ["After A", "After B", "After B"]
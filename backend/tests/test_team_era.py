@@ -88,6 +88,14 @@ async def test_team_service_create_era_and_duplicate(isolated_session):
             year=2022,
             registered_name="Service Era Again",
         )
+    # Session stays usable after the rejected insert
+    era_next = await TeamService.create_era(
+        isolated_session,
+        node_id=node_id,
+        year=2023,
+        registered_name="Service Era Next",
+    )
+    assert era_next.season_year == 2023
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,343 @@
+"""Tests for TimelineService result caching."""
+import asyncio
+
+import orjson
+import pytest
+
+from app.core.config import settings
+from app.models.team import TeamNode, TeamEra
+from app.models.lineage import LineageEvent
+from app.models.enums import EventType
+from app.models.sponsor import SponsorMaster, SponsorBrand, TeamSponsorLink
+from app.services import timeline_service
+from app.services.timeline_service import TimelineCache, TimelineService
+
+
+class FakeRedis:
+    """Minimal async stand-in for the Redis commands used by TimelineService."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+
+    async def incr(self, key):
+        self.store[key] = int(self.store.get(key, 0)) + 1
+        return self.store[key]
+
+    async def scan_iter(self, match):
+        prefix = match.rstrip("*")
+        for key in list(self.store):
+            if key.startswith(prefix):
+                yield key
+
+
+@pytest.fixture
+def timeline_cache(monkeypatch):
+    """Enable the timeline cache with a small bounded store for the test."""
+    monkeypatch.setattr(settings, "TIMELINE_CACHE_ENABLED", True)
+    cache = TimelineCache(maxsize=2, ttl=60)
+    monkeypatch.setattr(timeline_service, "timeline_cache", cache)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_returns_same_result(isolated_session, timeline_cache):
+    service = TimelineService(isolated_session)
+    first = await service.get_graph_data(2000, 2010, include_dissolved=True)
+    second = await service.get_graph_data(2000, 2010, include_dissolved=True)
+    assert second is first
+    assert len(timeline_cache.local) == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded(isolated_session, timeline_cache):
+    service = TimelineService(isolated_session)
+    for end_year in (2010, 2011, 2012):
+        await service.get_graph_data(2000, end_year, include_dissolved=True)
+    assert len(timeline_cache.local) == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_cache_clears_entries(isolated_session, timeline_cache):
+    service = TimelineService(isolated_session)
+    await service.get_graph_data(2000, 2010, include_dissolved=True)
+    TimelineService.invalidate_cache()
+    assert len(timeline_cache.local) == 0
+
+
+@pytest.mark.asyncio
+async def test_graph_json_is_cached_serialized(isolated_session, timeline_cache):
+    service = TimelineService(isolated_session)
+    body, etag = await service.get_graph_json(2000, 2010, include_dissolved=True)
+    assert orjson.loads(body) == await service.get_graph_data(2000, 2010, include_dissolved=True)
+    again = await service.get_graph_json(2000, 2010, include_dissolved=True)
+    assert again[0] is body and again[1] == etag
+    TimelineService.invalidate_cache()
+    assert len(timeline_cache.rendered) == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_build(isolated_session, monkeypatch):
+    calls = 0
+    original = TimelineService._build_graph_data
+
+    async def counting_build(self, *args, **kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return await original(self, *args, **kwargs)
+
+    monkeypatch.setattr(TimelineService, "_build_graph_data", counting_build)
+    service = TimelineService(isolated_session)
+    results = await asyncio.gather(
+        *(service.get_graph_data(2000, 2010, include_dissolved=True) for _ in range(5))
+    )
+    assert calls == 1
+    assert all(r is results[0] for r in results)
+    assert timeline_service.timeline_cache.inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_filters_are_applied_in_query(isolated_session):
+    active = TeamNode(founding_year=2000)
+    dissolved = TeamNode(founding_year=2000, dissolution_year=2005)
+    isolated_session.add_all([active, dissolved])
+    await isolated_session.flush()
+    isolated_session.add_all([
+        TeamEra(node_id=active.node_id, season_year=2001, registered_name="Active 2001", tier_level=1),
+        TeamEra(node_id=active.node_id, season_year=2002, registered_name="Active 2002", tier_level=2),
+        TeamEra(node_id=active.node_id, season_year=2020, registered_name="Active 2020", tier_level=1),
+        TeamEra(node_id=dissolved.node_id, season_year=2001, registered_name="Gone 2001", tier_level=1),
+    ])
+    await isolated_session.commit()
+
+    service = TimelineService(isolated_session)
+    data = await service.get_graph_data(2000, 2010, include_dissolved=False, tier_filter=[1])
+
+    assert [n["id"] for n in data["nodes"]] == [str(active.node_id)]
+    assert [e["name"] for e in data["nodes"][0]["eras"]] == ["Active 2001"]
+
+
+@pytest.mark.asyncio
+async def test_graph_build_issues_constant_number_of_queries(isolated_session, query_counter):
+    master = SponsorMaster(legal_name="Query Count Co")
+    isolated_session.add(master)
+    await isolated_session.flush()
+    brand = SponsorBrand(master_id=master.master_id, brand_name="QC", default_hex_color="#123456")
+    nodes = [TeamNode(founding_year=2000) for _ in range(3)]
+    isolated_session.add_all([brand, *nodes])
+    await isolated_session.flush()
+    for node in nodes:
+        for year in (2001, 2002):
+            era = TeamEra(node_id=node.node_id, season_year=year, registered_name=f"Team {year}")
+            era.sponsor_links.append(
+                TeamSponsorLink(brand_id=brand.brand_id, rank_order=1, prominence_percent=100)
+            )
+            isolated_session.add(era)
+    isolated_session.add(LineageEvent(
+        previous_node_id=nodes[0].node_id,
+        next_node_id=nodes[1].node_id,
+        event_year=2002,
+        event_type=EventType.LEGAL_TRANSFER,
+    ))
+    await isolated_session.commit()
+    isolated_session.expunge_all()
+
+    query_counter.clear()
+    data = await TimelineService(isolated_session).get_graph_data(2000, 2010, include_dissolved=True)
+
+    assert len(data["nodes"]) == 3
+    assert data["nodes"][0]["eras"][0]["sponsors"][0]["brand"] == "QC"
+    # eras + nodes + sponsor links + brands + events, regardless of row counts
+    assert len(query_counter) == 5
+
+
+@pytest.fixture
+def shared_cache(monkeypatch):
+    """Timeline cache backed by an in-memory stand-in for the Redis tier."""
+    monkeypatch.setattr(settings, "TIMELINE_CACHE_ENABLED", True)
+    cache = TimelineCache(maxsize=2, ttl=60, redis=FakeRedis())
+    monkeypatch.setattr(timeline_service, "timeline_cache", cache)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_is_reused_by_other_workers(isolated_session, shared_cache, monkeypatch):
+    first = await TimelineService(isolated_session).get_graph_data(2000, 2010, include_dissolved=True)
+    assert len(shared_cache.get_redis().store) == 1
+
+    # Simulate another worker: empty local cache, shared cache still warm
+    shared_cache.clear()
+
+    async def fail_build(self, *args, **kwargs):
+        raise AssertionError("graph should come from the shared cache")
+
+    monkeypatch.setattr(TimelineService, "_build_graph_data", fail_build)
+    second = await TimelineService(isolated_session).get_graph_data(2000, 2010, include_dissolved=True)
+    assert second == first
+
+
+@pytest.mark.asyncio
+async def test_invalidate_cache_purges_shared_cache(isolated_session, shared_cache):
+    await TimelineService(isolated_session).get_graph_data(2000, 2010, include_dissolved=True)
+    TimelineService.invalidate_cache()
+    await shared_cache.wait_for_purges()
+    assert list(shared_cache.get_redis().store) == [TimelineCache.GENERATION_KEY]
+
+
+@pytest.mark.asyncio
+async def test_invalidation_in_one_worker_reaches_the_other(isolated_session, monkeypatch):
+    monkeypatch.setattr(settings, "TIMELINE_CACHE_ENABLED", True)
+    redis = FakeRedis()
+    # One cache per worker process, sharing the Redis tier
+    worker_a = TimelineCache(maxsize=2, ttl=60, redis=redis)
+    worker_b = TimelineCache(maxsize=2, ttl=60, redis=redis)
+    service_a = TimelineService(isolated_session, cache=worker_a)
+
+    before = await service_a.get_graph_data(2000, 2010, include_dissolved=True)
+    _, etag = await service_a.get_graph_json(2000, 2010, include_dissolved=True)
+    assert len(worker_a.local) == 0
+    assert len(worker_a.rendered) == 0
+
+    node = TeamNode(founding_year=2000)
+    isolated_session.add(node)
+    await isolated_session.flush()
+    isolated_session.add(TeamEra(node_id=node.node_id, season_year=2005, registered_name="Fresh"))
+    await isolated_session.flush()
+    worker_b.invalidate()
+    await worker_b.wait_for_purges()
+
+    after = await service_a.get_graph_data(2000, 2010, include_dissolved=True)
+    assert len(after["nodes"]) == len(before["nodes"]) + 1
+    body, new_etag = await service_a.get_graph_json(
+        2000, 2010, include_dissolved=True, if_none_match=etag
+    )
+    assert body is not None
+    assert new_etag != etag
+
+
+@pytest.mark.asyncio
+async def test_build_overlapping_other_workers_invalidation_is_not_shared(isolated_session, monkeypatch):
+    monkeypatch.setattr(settings, "TIMELINE_CACHE_ENABLED", True)
+    redis = FakeRedis()
+    worker_a = TimelineCache(maxsize=2, ttl=60, redis=redis)
+    worker_b = TimelineCache(maxsize=2, ttl=60, redis=redis)
+    build = TimelineService._build_graph_data
+
+    async def build_then_invalidate_elsewhere(self, *args, **kwargs):
+        result = await build(self, *args, **kwargs)
+        # Worker B commits after A has read the data but before A writes it back
+        worker_b.invalidate()
+        await worker_b.wait_for_purges()
+        return result
+
+    monkeypatch.setattr(TimelineService, "_build_graph_data", build_then_invalidate_elsewhere)
+    await TimelineService(isolated_session, cache=worker_a).get_graph_data(2000, 2010, include_dissolved=True)
+    monkeypatch.setattr(TimelineService, "_build_graph_data", build)
+
+    builds = []
+
+    async def counting_build(self, *args, **kwargs):
+        builds.append(args)
+        return await build(self, *args, **kwargs)
+
+    monkeypatch.setattr(TimelineService, "_build_graph_data", counting_build)
+    await TimelineService(isolated_session, cache=worker_b).get_graph_data(2000, 2010, include_dissolved=True)
+    assert len(builds) == 1
+
+
+@pytest.mark.asyncio
+async def test_service_uses_injected_cache(isolated_session, timeline_cache):
+    own_cache = TimelineCache(maxsize=2, ttl=60)
+    await TimelineService(isolated_session, cache=own_cache).get_graph_data(2000, 2010, include_dissolved=True)
+    assert len(own_cache.local) == 1
+    assert len(timeline_cache.local) == 0
+
+
+@pytest.mark.asyncio
+async def test_injected_cache_is_invalidated(isolated_session, timeline_cache):
+    own_cache = TimelineCache(maxsize=2, ttl=60)
+    service = TimelineService(isolated_session, cache=own_cache)
+    await service.get_graph_data(2000, 2010, include_dissolved=True)
+    TimelineService.invalidate_cache()
+    assert len(own_cache.local) == 0
+
+    await service.get_graph_data(2000, 2010, include_dissolved=True)
+    node = TeamNode(founding_year=2000)
+    isolated_session.add(node)
+    await isolated_session.commit()
+    assert len(own_cache.local) == 0
+
+
+@pytest.mark.asyncio
+async def test_committed_timeline_write_invalidates_cache(isolated_session, timeline_cache):
+    service = TimelineService(isolated_session)
+    before = await service.get_graph_data(2000, 2010, include_dissolved=True)
+    assert len(timeline_cache.local) == 1
+
+    node = TeamNode(founding_year=2000)
+    isolated_session.add(node)
+    await isolated_session.flush()
+    # Flushed but uncommitted changes keep the cache
+    assert len(timeline_cache.local) == 1
+
+    isolated_session.add(TeamEra(node_id=node.node_id, season_year=2005, registered_name="Fresh"))
+    await isolated_session.commit()
+    assert len(timeline_cache.local) == 0
+
+    after = await service.get_graph_data(2000, 2010, include_dissolved=True)
+    assert len(after["nodes"]) == len(before["nodes"]) + 1
+
+
+@pytest.mark.asyncio
+async def test_repository_concurrent_reads_use_app_session_factory(tmp_path, monkeypatch):
+    """The concurrent path reads events on a session from the app's factory."""
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from app.db import database as database_module
+    from app.db.base import Base
+    from app.repositories.timeline_repository import TimelineRepository
+
+    # A file-backed database gives each session its own connection, as a server pool would
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'timeline.db'}")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        opened = []
+
+        def app_session_maker():
+            session = maker()
+            opened.append(session)
+            return session
+
+        monkeypatch.setattr(database_module, "async_session_maker", app_session_maker)
+
+        async with maker() as session:
+            a = TeamNode(founding_year=2010)
+            b = TeamNode(founding_year=2012)
+            session.add_all([a, b])
+            await session.flush()
+            session.add_all([
+                TeamEra(node_id=a.node_id, season_year=2011, registered_name="A", tier_level=1),
+                LineageEvent(previous_node_id=a.node_id, next_node_id=b.node_id, event_year=2012, event_type=EventType.LEGAL_TRANSFER),
+            ])
+            await session.commit()
+
+            eras, events = await TimelineRepository(concurrent=True).fetch_eras_and_events(
+                session, start_year=2010, end_year=2020
+            )
+
+        assert [era.registered_name for era in eras] == ["A"]
+        assert eras[0].node.node_id == a.node_id
+        assert [(e.previous_node_id, e.next_node_id) for e in events] == [(a.node_id, b.node_id)]
+        assert len(opened) == 1
+    finally:
+        await engine.dispose()